@@ -1,3 +1,3 @@
 """CodeMap - LLM-friendly codebase indexer."""
 
-__version__ = "1.2.0"
+__version__ = "1.2.82"
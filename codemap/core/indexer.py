@@ -250,16 +250,10 @@ class Indexer:
             logger.debug(f"No parser for language {language}")
             return []
 
-        # Read file content
+        # Parse symbols; parse_file lets byte-oriented parsers mmap the
+        # source instead of decoding it here first
         try:
-            content = filepath.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            # Try with errors='replace' for non-UTF-8 files
-            content = filepath.read_text(encoding="utf-8", errors="replace")
-
-        # Parse symbols
-        try:
-            symbols = parser.parse(content, str(filepath))
+            symbols = parser.parse_file(filepath)
         except SyntaxError as e:
             logger.warning(f"Syntax error in {filepath}: {e}")
             symbols = []
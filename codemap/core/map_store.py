@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import shutil
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Iterator, Optional
 
@@ -14,6 +18,43 @@ from difflib import SequenceMatcher
 from ..parsers.base import Symbol
 
 
+@functools.lru_cache(maxsize=65536)
+def _tokenize(text: str) -> frozenset[str]:
+    """Split a lowercased string into word tokens (on spaces, -, _).
+
+    Cached because the same names recur across queries: repeated lookups
+    in a long-lived store (watch mode) hit the cache instead of re-running
+    two replaces and a split per candidate.
+    """
+    return frozenset(text.replace("-", " ").replace("_", " ").split())
+
+
+def _split_rel_path(rel_path: str) -> tuple[str, str]:
+    """Split a relative file path into (directory, filename).
+
+    String rpartition instead of pathlib: the per-entry Path construction
+    showed up in save/lookup profiles, and map keys are plain "/" joined
+    strings anyway. Backslashes are normalized like should_exclude does.
+    Returns ("", name) for root-level files.
+    """
+    directory, _, filename = rel_path.replace("\\", "/").rpartition("/")
+    return directory, filename
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Write text to path via a temp file and os.replace.
+
+    The rename is atomic on POSIX and Windows, so concurrent readers
+    (another CLI invocation, a watcher process) never observe a partially
+    written map — they see the old file or the new one. No fsync: the
+    index is rebuildable, so crash durability is not worth stalling every
+    save on a disk flush.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
 @dataclass
 class FileEntry:
     """Represents a file entry in the codemap."""
@@ -130,6 +171,16 @@ class MapStore:
         self.codemap_dir = self.root / self.CODEMAP_DIR
         self._manifest: Optional[RootManifest] = None
         self._dir_maps: dict[str, DirectoryMap] = {}  # Cache for directory maps
+        self._dirty_dirs: set[str] = set()  # Directories with unsaved changes
+        # (st_mtime_ns, st_size) of each cached map file, None if absent
+        self._dir_map_stats: dict[str, Optional[tuple[int, int]]] = {}
+        self._cache_lock = threading.Lock()
+        # Flattened (filepath, symbol, lowercase name, name tokens)
+        # occurrences plus an exact-name lookup table; built lazily,
+        # dropped on any change
+        self._symbol_index: Optional[
+            tuple[list[tuple[str, Symbol, str, frozenset[str]]], dict[str, list[int]]]
+        ] = None
 
     @property
     def manifest(self) -> RootManifest:
@@ -196,31 +247,89 @@ class MapStore:
             return self.codemap_dir / "_root.codemap.json"
         return self.codemap_dir / directory / self.MANIFEST_FILE
 
+    @staticmethod
+    def _stat_key(map_path: Path) -> Optional[tuple[int, int]]:
+        """Cheap change signature for a map file (mtime_ns, size)."""
+        try:
+            st = map_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _read_dir_map(map_path: Path, directory: str) -> DirectoryMap:
+        """Parse a directory map from disk; empty map if missing or corrupt."""
+        try:
+            with open(map_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return DirectoryMap.from_dict(data)
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return DirectoryMap(directory=directory)
+
     def _load_dir_map(self, directory: str) -> DirectoryMap:
         """Load a directory's codemap.
 
+        Cached maps are served without re-reading while the on-disk file
+        is unchanged (same mtime_ns and size), so a long-lived store (e.g.
+        watch mode) stays fast yet picks up maps rewritten by another
+        process. Maps with unsaved edits are never revalidated away.
+
         Args:
             directory: Relative directory path.
 
         Returns:
             DirectoryMap object.
         """
-        if directory in self._dir_maps:
-            return self._dir_maps[directory]
-
         map_path = self._get_dir_map_path(directory)
-        if not map_path.exists():
-            dir_map = DirectoryMap(directory=directory)
-        else:
-            try:
-                with open(map_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                dir_map = DirectoryMap.from_dict(data)
-            except (json.JSONDecodeError, KeyError):
-                dir_map = DirectoryMap(directory=directory)
-
-        self._dir_maps[directory] = dir_map
-        return dir_map
+        with self._cache_lock:
+            if directory in self._dir_maps:
+                if (
+                    directory in self._dirty_dirs
+                    or self._dir_map_stats.get(directory) == self._stat_key(map_path)
+                ):
+                    return self._dir_maps[directory]
+
+            dir_map = self._read_dir_map(map_path, directory)
+            self._dir_maps[directory] = dir_map
+            self._dir_map_stats[directory] = self._stat_key(map_path)
+            self._symbol_index = None
+            return dir_map
+
+    def _preload_dir_maps(self) -> None:
+        """Load every directory map in the manifest into the cache.
+
+        Used by the full-walk paths (symbol index build, update_stats)
+        before they iterate. Reads run on a thread pool: JSON parsing
+        holds the GIL, but the open/read I/O overlaps, which is where the
+        time goes on a cold page cache. Small manifests load sequentially
+        where pool startup would dominate.
+        """
+        with self._cache_lock:
+            missing = [
+                d for d in self.manifest.directories if d not in self._dir_maps
+            ]
+        if not missing:
+            return
+        if len(missing) < 4:
+            for directory in missing:
+                self._load_dir_map(directory)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def read_one(directory: str) -> tuple[str, DirectoryMap, Optional[tuple[int, int]]]:
+            map_path = self._get_dir_map_path(directory)
+            return directory, self._read_dir_map(map_path, directory), self._stat_key(map_path)
+
+        with ThreadPoolExecutor(max_workers=min(32, len(missing))) as pool:
+            loaded = list(pool.map(read_one, missing))
+
+        with self._cache_lock:
+            for directory, dir_map, stat_key in loaded:
+                if directory not in self._dir_maps:
+                    self._dir_maps[directory] = dir_map
+                    self._dir_map_stats[directory] = stat_key
+                    self._symbol_index = None
 
     def _save_dir_map(self, directory: str) -> None:
         """Save a directory's codemap.
@@ -238,9 +347,15 @@ class MapStore:
         # Create parent directories
         map_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = dir_map.to_dict()
-        with open(map_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
+        # Serialize in one shot: json.dump issues a write per token, while
+        # dumps + a single write lets the encoder run its C fast path
+        _write_text_atomic(
+            map_path,
+            json.dumps(dir_map.to_dict(), indent=2, sort_keys=True),
+        )
+
+        # The cached copy now matches what is on disk
+        self._dir_map_stats[directory] = self._stat_key(map_path)
 
     def save_manifest(self) -> None:
         """Save the root manifest."""
@@ -248,15 +363,22 @@ class MapStore:
         self.manifest.generated_at = datetime.now(timezone.utc).isoformat()
 
         manifest_path = self.codemap_dir / self.MANIFEST_FILE
-        data = self.manifest.to_dict()
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
+        _write_text_atomic(
+            manifest_path,
+            json.dumps(self.manifest.to_dict(), indent=2, sort_keys=True),
+        )
 
     def save(self) -> None:
-        """Save all modified directory maps and the manifest."""
-        # Save all cached directory maps
-        for directory in list(self._dir_maps.keys()):
+        """Save all modified directory maps and the manifest.
+
+        Only directories touched since the last save are written; loading a
+        map for reading (find/validate/stats walks fill the cache) does not
+        mark it dirty, so a single-file update rewrites one map instead of
+        every cached one.
+        """
+        for directory in sorted(self._dirty_dirs):
             self._save_dir_map(directory)
+        self._dirty_dirs.clear()
 
         # Save manifest
         self.save_manifest()
@@ -268,7 +390,7 @@ class MapStore:
         language: str,
         lines: int,
         symbols: list[Symbol],
-    ) -> None:
+    ) -> bool:
         """Update or add a file entry.
 
         Args:
@@ -277,15 +399,28 @@ class MapStore:
             language: Programming language.
             lines: Number of lines in file.
             symbols: List of extracted symbols.
+
+        Returns:
+            True if the entry changed, False for a no-op update.
         """
         # Determine which directory this file belongs to
-        path = Path(rel_path)
-        directory = str(path.parent) if path.parent != Path(".") else ""
-        filename = path.name
+        directory, filename = _split_rel_path(rel_path)
 
         # Load or create the directory map
         dir_map = self._load_dir_map(directory)
 
+        # No-op fast path: same content and same extraction means nothing
+        # to rewrite — the map stays clean and save() skips it entirely.
+        # Symbols are compared too so a parser change still refreshes the
+        # entry even when the file content hash is unchanged.
+        existing = dir_map.files.get(filename)
+        if (
+            existing is not None
+            and existing.hash == hash
+            and existing.symbols == symbols
+        ):
+            return False
+
         # Add/update the file entry
         dir_map.files[filename] = FileEntry(
             hash=hash,
@@ -295,9 +430,13 @@ class MapStore:
             symbols=symbols,
         )
 
+        self._dirty_dirs.add(directory)
+        self._symbol_index = None
+
         # Ensure directory is in the manifest
         if directory not in self.manifest.directories:
             self.manifest.directories.append(directory)
+        return True
 
     def remove_file(self, rel_path: str) -> bool:
         """Remove a file entry.
@@ -308,20 +447,22 @@ class MapStore:
         Returns:
             True if file was removed, False if it didn't exist.
         """
-        path = Path(rel_path)
-        directory = str(path.parent) if path.parent != Path(".") else ""
-        filename = path.name
+        directory, filename = _split_rel_path(rel_path)
 
         dir_map = self._load_dir_map(directory)
         if filename in dir_map.files:
             del dir_map.files[filename]
+            self._dirty_dirs.add(directory)
+            self._symbol_index = None
 
             # If directory is now empty, remove it from manifest and cache
             if not dir_map.files:
+                self._dirty_dirs.discard(directory)
                 if directory in self.manifest.directories:
                     self.manifest.directories.remove(directory)
                 if directory in self._dir_maps:
                     del self._dir_maps[directory]
+                self._dir_map_stats.pop(directory, None)
                 # Remove the empty directory's codemap file
                 map_path = self._get_dir_map_path(directory)
                 if map_path.exists():
@@ -344,9 +485,7 @@ class MapStore:
         Returns:
             FileEntry or None if not found.
         """
-        path = Path(rel_path)
-        directory = str(path.parent) if path.parent != Path(".") else ""
-        filename = path.name
+        directory, filename = _split_rel_path(rel_path)
 
         dir_map = self._load_dir_map(directory)
         return dir_map.files.get(filename)
@@ -394,10 +533,17 @@ class MapStore:
             List of matching results with file, name, type, and lines.
             Results are sorted by match quality when fuzzy is enabled.
         """
-        results = []
         query_lower = query.lower()
-        query_words = set(query_lower.replace("-", " ").replace("_", " ").split())
+        query_words = _tokenize(query_lower)
+
+        # Non-fuzzy searches only look at symbol names, so they can run
+        # over the flattened index; fuzzy also scores filenames and
+        # docstrings and keeps the full walk.
+        if not fuzzy:
+            return self._find_symbol_indexed(query_lower, query_words, symbol_type)
 
+        results = []
+        self._preload_dir_maps()
         for directory in self.manifest.directories:
             dir_map = self._load_dir_map(directory)
             for filename, entry in dir_map.files.items():
@@ -434,9 +580,122 @@ class MapStore:
                         )
                     )
 
-        # Sort by score descending, then strip internal score field
-        results.sort(key=lambda r: r.get("_score", 0), reverse=True)
-        return [{k: v for k, v in r.items() if k != "_score"} for r in results]
+        # Sort by score descending, then strip internal score field. Every
+        # result carries _score, so itemgetter beats a lambda with .get, and
+        # the dicts are freshly built here so they can be mutated in place
+        # instead of rebuilt.
+        results.sort(key=itemgetter("_score"), reverse=True)
+        for result in results:
+            del result["_score"]
+        return results
+
+    def _get_symbol_index(
+        self,
+    ) -> tuple[list[tuple[str, Symbol, str, frozenset[str]]], dict[str, list[int]]]:
+        """Flattened symbol occurrences plus an exact-name lookup table.
+
+        Built lazily on first use and kept until any file entry changes, so
+        repeated queries scan one flat list instead of re-walking every
+        directory map and symbol tree. Each occurrence carries the
+        lowercased name and its token set, precomputed once here instead
+        of per candidate on every query.
+        """
+        if self._symbol_index is None:
+            self._preload_dir_maps()
+            occurrences: list[tuple[str, Symbol, str, frozenset[str]]] = []
+            by_name: dict[str, list[int]] = {}
+            for directory in self.manifest.directories:
+                dir_map = self._load_dir_map(directory)
+                for filename, entry in dir_map.files.items():
+                    filepath = f"{directory}/{filename}" if directory else filename
+                    for symbol in entry.symbols:
+                        self._index_symbol(symbol, filepath, occurrences, by_name)
+            self._symbol_index = (occurrences, by_name)
+        return self._symbol_index
+
+    @staticmethod
+    def _index_symbol(
+        symbol: Symbol,
+        filepath: str,
+        occurrences: list[tuple[str, Symbol, str, frozenset[str]]],
+        by_name: dict[str, list[int]],
+    ) -> None:
+        """Record a symbol and its children (pre-order) in the flattened index.
+
+        Iterative with an explicit stack, like _count_symbols; children are
+        pushed reversed so they are popped in document order.
+        """
+        stack = [symbol]
+        while stack:
+            current = stack.pop()
+            name_lower = current.name.lower()
+            by_name.setdefault(name_lower, []).append(len(occurrences))
+            occurrences.append((filepath, current, name_lower, _tokenize(name_lower)))
+            if current.children:
+                stack.extend(reversed(current.children))
+
+    def _find_symbol_indexed(
+        self,
+        query: str,
+        query_words: set[str],
+        symbol_type: Optional[str],
+    ) -> list[dict[str, Any]]:
+        """Non-fuzzy search over the flattened symbol index.
+
+        Exact hits come straight from the name table; the substring and
+        word-overlap tiers still score every name, but over a flat list
+        with no per-query recursion.
+        """
+        occurrences, by_name = self._get_symbol_index()
+        results = []
+
+        # Specialized list-all mode (e.g. find "" --type class): an empty
+        # query hits the substring tier for every name, so scoring each
+        # candidate is pure overhead. Guarded on no empty-named symbols,
+        # which would outrank the rest via the exact tier.
+        if not query and "" not in by_name:
+            results = [
+                self._result_dict(filepath, symbol, 0.9)
+                for filepath, symbol, _, _ in occurrences
+                if symbol_type is None or symbol.type == symbol_type
+            ]
+            for result in results:
+                del result["_score"]
+            return results
+
+        exact = by_name.get(query, []) if query else []
+        for i in exact:
+            filepath, symbol = occurrences[i][:2]
+            if symbol_type is None or symbol.type == symbol_type:
+                results.append(self._result_dict(filepath, symbol, 1.0))
+
+        exact_positions = set(exact)
+        for i, (filepath, symbol, name_lower, name_words) in enumerate(occurrences):
+            if i in exact_positions:
+                continue
+            score = self._match_score(
+                query, query_words, name_lower, fuzzy=False, target_words=name_words
+            )
+            if score > 0 and (symbol_type is None or symbol.type == symbol_type):
+                results.append(self._result_dict(filepath, symbol, score))
+
+        results.sort(key=itemgetter("_score"), reverse=True)
+        for result in results:
+            del result["_score"]
+        return results
+
+    @staticmethod
+    def _result_dict(filepath: str, symbol: Symbol, score: float) -> dict[str, Any]:
+        """Build a find_symbol result entry for a symbol."""
+        return {
+            "file": filepath,
+            "name": symbol.name,
+            "type": symbol.type,
+            "lines": list(symbol.lines),
+            "signature": symbol.signature,
+            "docstring": symbol.docstring,
+            "_score": score,
+        }
 
     def _search_symbol(
         self,
@@ -469,15 +728,7 @@ class MapStore:
 
         if score > 0:
             if symbol_type is None or symbol.type == symbol_type:
-                yield {
-                    "file": filepath,
-                    "name": symbol.name,
-                    "type": symbol.type,
-                    "lines": list(symbol.lines),
-                    "signature": symbol.signature,
-                    "docstring": symbol.docstring,
-                    "_score": score,
-                }
+                yield self._result_dict(filepath, symbol, score)
 
         # Search children
         for child in symbol.children:
@@ -496,6 +747,7 @@ class MapStore:
         query_words: set[str],
         target: str,
         fuzzy: bool,
+        target_words: Optional[frozenset[str]] = None,
     ) -> float:
         """Score how well a query matches a target string.
 
@@ -511,6 +763,8 @@ class MapStore:
             query_words: Set of words in the query.
             target: Lowercase target string to match against.
             fuzzy: Enable fuzzy similarity scoring.
+            target_words: Precomputed token set for target (e.g. from the
+                symbol index); computed here when not supplied.
 
         Returns:
             Score between 0.0 and 1.0. 0.0 means no match.
@@ -523,16 +777,17 @@ class MapStore:
         if query in target:
             return 0.9
 
-        # Word-level matching (split on spaces, hyphens, underscores)
-        target_words = set(target.replace("-", " ").replace("_", " ").split())
-        if query_words and target_words:
-            overlap = query_words & target_words
-            if overlap:
-                ratio = len(overlap) / len(query_words)
-                if ratio >= 1.0:
-                    return 0.7  # All query words found
-                elif ratio >= 0.5:
-                    return 0.5  # At least half
+        # Word-level matching (split on spaces, hyphens, underscores).
+        # isdisjoint first: most candidates share no tokens with the query,
+        # and it bails out without building the intersection set.
+        if target_words is None:
+            target_words = _tokenize(target)
+        if query_words and not query_words.isdisjoint(target_words):
+            ratio = len(query_words & target_words) / len(query_words)
+            if ratio >= 1.0:
+                return 0.7  # All query words found
+            elif ratio >= 0.5:
+                return 0.5  # At least half
 
         if not fuzzy:
             return 0.0
@@ -549,6 +804,7 @@ class MapStore:
         total_files = 0
         total_symbols = 0
 
+        self._preload_dir_maps()
         for directory in self.manifest.directories:
             dir_map = self._load_dir_map(directory)
             total_files += len(dir_map.files)
@@ -561,9 +817,13 @@ class MapStore:
             "last_full_index": datetime.now(timezone.utc).isoformat(),
         }
 
-    def _count_symbols(self, symbols: list[Symbol] | None) -> int:
+    @staticmethod
+    def _count_symbols(symbols: list[Symbol] | None) -> int:
         """Count total symbols including children.
 
+        Iterative with an explicit stack: no Python frame per tree level,
+        and deep trees cannot hit the recursion limit.
+
         Args:
             symbols: List of symbols.
 
@@ -572,10 +832,13 @@ class MapStore:
         """
         if not symbols:
             return 0
-        count = len(symbols)
-        for symbol in symbols:
+        count = 0
+        stack = list(symbols)
+        while stack:
+            symbol = stack.pop()
+            count += 1
             if symbol.children:
-                count += self._count_symbols(symbol.children)
+                stack.extend(symbol.children)
         return count
 
     def set_metadata(self, root: str, config: dict) -> None:
@@ -609,6 +872,9 @@ class MapStore:
             shutil.rmtree(self.codemap_dir)
         self._manifest = RootManifest()
         self._dir_maps.clear()
+        self._dirty_dirs.clear()
+        self._dir_map_stats.clear()
+        self._symbol_index = None
 
 
 # Legacy compatibility aliases
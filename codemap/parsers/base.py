@@ -2,21 +2,37 @@
 
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass
+from typing import Iterable, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Symbol:
-    """Represents a code symbol (class, function, method, etc.)."""
+    """Represents a code symbol (class, function, method, etc.).
+
+    Slotted and frozen: parsers allocate one of these per declaration, so
+    dropping the per-instance __dict__ cuts memory substantially on large
+    repos. "Mutation" goes through dataclasses.replace.
+
+    children is stored as a tuple so the record is fully immutable and all
+    leaves share one empty tuple instead of allocating an empty list each;
+    any iterable (or None) passed by a parser is coerced.
+    """
 
     name: str
     type: str  # class, function, method, async_function, async_method
     lines: tuple[int, int]  # (start_line, end_line), 1-indexed
     signature: Optional[str] = None
     docstring: Optional[str] = None
-    children: list["Symbol"] = field(default_factory=list)
+    children: tuple["Symbol", ...] = ()
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.children, tuple):
+            object.__setattr__(
+                self, "children", tuple(self.children) if self.children else ()
+            )
 
     def to_dict(self) -> dict:
         """Convert symbol to dictionary for JSON serialization."""
@@ -39,16 +55,37 @@ class Symbol:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Symbol":
-        """Create a Symbol from a dictionary."""
-        children = [cls.from_dict(c) for c in data.get("children", [])]
-        return cls(
-            name=data["name"],
-            type=data["type"],
-            lines=tuple(data["lines"]),
-            signature=data.get("signature"),
-            docstring=data.get("docstring"),
-            children=children if children else [],
-        )
+        """Create a Symbol from a dictionary.
+
+        Iterative post-order over an explicit stack: children are built
+        before their parent so the children tuple is complete at
+        construction, without a Python call frame per tree level.
+        """
+        stack: list[tuple[dict, bool]] = [(data, False)]
+        built: list["Symbol"] = []
+        while stack:
+            node, expanded = stack.pop()
+            kids = node.get("children")
+            if kids and not expanded:
+                stack.append((node, True))
+                # Reversed so children are popped (and built) in order
+                stack.extend((kid, False) for kid in reversed(kids))
+                continue
+            children: tuple["Symbol", ...] = ()
+            if kids:
+                children = tuple(built[-len(kids):])
+                del built[-len(kids):]
+            built.append(
+                cls(
+                    name=node["name"],
+                    type=node["type"],
+                    lines=tuple(node["lines"]),
+                    signature=node.get("signature"),
+                    docstring=node.get("docstring"),
+                    children=children,
+                )
+            )
+        return built[0]
 
 
 class Parser(ABC):
@@ -76,6 +113,27 @@ class Parser(ABC):
         """
         pass
 
+    def parse_file(self, filepath: str | "os.PathLike[str]") -> list[Symbol]:
+        """Parse a source file from disk.
+
+        The default implementation reads and decodes the file, then delegates
+        to parse(). Byte-oriented parsers override this with a zero-copy path.
+
+        Args:
+            filepath: Path to the file.
+
+        Returns:
+            List of top-level Symbol objects.
+        """
+        try:
+            with open(filepath, encoding="utf-8") as f:
+                content = f.read()
+        except UnicodeDecodeError:
+            # Try with errors='replace' for non-UTF-8 files
+            with open(filepath, encoding="utf-8", errors="replace") as f:
+                content = f.read()
+        return self.parse(content, str(filepath))
+
     def can_parse(self, filepath: str) -> bool:
         """Check if this parser can handle the given file.
 
@@ -86,3 +144,58 @@ class Parser(ABC):
             True if this parser handles the file's extension.
         """
         return any(filepath.endswith(ext) for ext in self.extensions)
+
+    @classmethod
+    def parse_many(
+        cls,
+        items: Iterable[tuple[str, str]],
+        workers: int | None = None,
+    ) -> list[tuple[str, list[Symbol]]]:
+        """Parse many (source, filepath) pairs, fanning out to a process pool.
+
+        Parsing is CPU-bound and independent per file, so large batches are
+        dispatched via ProcessPoolExecutor (one parser instance cached per
+        worker process). Small batches are parsed sequentially, where pool
+        startup would dominate.
+
+        Args:
+            items: Iterable of (source, filepath) pairs.
+            workers: Number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            List of (filepath, symbols) pairs in input order.
+        """
+        items = list(items)
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers < 2 or len(items) < 4:
+            # Reuse the per-process cached instance so repeated small batches
+            # don't pay parser construction (grammar loads) each call.
+            parser = _WORKER_PARSERS.get(cls)
+            if parser is None:
+                parser = _WORKER_PARSERS[cls] = cls()
+            return [(filepath, parser.parse(source, filepath)) for source, filepath in items]
+
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+
+        sources = [source for source, _ in items]
+        paths = [filepath for _, filepath in items]
+        # chunksize > 1 amortizes pickling overhead across tasks
+        chunksize = max(1, len(items) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_parse_in_worker, repeat(cls), sources, paths, chunksize=chunksize)
+            return list(zip(paths, results))
+
+
+# One parser instance per worker process, keyed by parser class.
+_WORKER_PARSERS: dict[type, Parser] = {}
+
+
+def _parse_in_worker(parser_cls: type, source: str, filepath: str) -> list[Symbol]:
+    """Parse one source in a worker process (used by Parser.parse_many)."""
+    parser = _WORKER_PARSERS.get(parser_cls)
+    if parser is None:
+        parser = _WORKER_PARSERS[parser_cls] = parser_cls()
+    return parser.parse(source, filepath)
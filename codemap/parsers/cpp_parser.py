@@ -142,7 +142,7 @@ class CppParser(TreeSitterParser):
 
     def _extract_symbol(self, node, source_bytes):
         """Override to handle C++-specific node structures."""
-        mapping = self.config.node_mappings.get(node.type)
+        mapping = self._mappings.get(node.type)
         if not mapping:
             return None
 
@@ -9,7 +9,6 @@ from .base import Symbol
 
 # Tree-sitter imports - uses language-pack since standalone dart package unavailable
 try:
-    from tree_sitter import Parser as TSParser
     from tree_sitter_language_pack import get_language
     TREE_SITTER_AVAILABLE = True
 except ImportError:
@@ -75,14 +74,14 @@ class DartParser(TreeSitterParser):
     extensions = [".dart"]
     language = "dart"
 
-    def __init__(self):
-        """Initialize the Dart parser using tree-sitter-language-pack."""
+    def _load_grammar(self):
+        """Load the Dart grammar from tree-sitter-language-pack."""
         if not TREE_SITTER_AVAILABLE:
             raise ImportError(
                 "tree-sitter and tree-sitter-language-pack are required. "
                 "Install with: pip install tree-sitter tree-sitter-language-pack"
             )
-        self._parser = TSParser(get_language("dart"))
+        return get_language("dart")
 
     def _extract_symbols(self, node, source_bytes: bytes) -> list[Symbol]:
         """Extract symbols from AST node."""
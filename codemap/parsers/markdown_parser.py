@@ -38,60 +38,68 @@ class MarkdownParser(Parser):
 
             headers.append((level, line_num, title, match.start()))
 
-        # Build symbol tree
-        symbols: list[Symbol] = []
-        h2_stack: list[Symbol] = []  # Track current H2 for nesting H3s
-        h3_stack: list[Symbol] = []  # Track current H3 for nesting H4s
+        # Precompute end lines, then build the tree bottom-up so each
+        # Symbol's children tuple is complete before it is constructed
+        ends = self._compute_end_lines(headers, total_lines)
+        symbols, _ = self._build_tree(headers, ends, lines, 0, 1)
+        return symbols
 
-        for i, (level, start_line, title, _) in enumerate(headers):
-            # Find end line (start of next header at same or higher level, or EOF)
+    @staticmethod
+    def _compute_end_lines(
+        headers: list[tuple[int, int, str, int]], total_lines: int
+    ) -> list[int]:
+        """End line per header: line before the next same-or-higher header."""
+        ends = []
+        for i, (level, _, _, _) in enumerate(headers):
             end_line = total_lines
             for j in range(i + 1, len(headers)):
                 next_level, next_line, _, _ = headers[j]
                 if next_level <= level:
                     end_line = next_line - 1
                     break
+            ends.append(end_line)
+        return ends
+
+    def _build_tree(
+        self,
+        headers: list[tuple[int, int, str, int]],
+        ends: list[int],
+        lines: list[str],
+        start: int,
+        parent_level: int,
+    ) -> tuple[list[Symbol], int]:
+        """Build symbols from headers nested deeper than parent_level.
+
+        Recursive descent over the flat header list: a header's children
+        are the following headers with a deeper level, ending at the next
+        header at the same or a shallower level. Orphans (e.g. an H4 with
+        no H3 above it) attach to whatever shallower header encloses them,
+        or to the root.
+
+        Returns:
+            (symbols, index of the first unconsumed header).
+        """
+        symbols: list[Symbol] = []
+        i = start
+        while i < len(headers) and headers[i][0] > parent_level:
+            level, start_line, title, _ = headers[i]
+            end_line = ends[i]
+            children, i = self._build_tree(headers, ends, lines, i + 1, level)
 
-            # Determine symbol type based on header level
             symbol_type = {2: "section", 3: "subsection", 4: "subsubsection"}.get(
                 level, "section"
             )
-
-            symbol = Symbol(
-                name=title,
-                type=symbol_type,
-                lines=(start_line, end_line),
-                signature=None,
-                docstring=self._extract_first_paragraph(lines, start_line, end_line),
-                children=[],
+            symbols.append(
+                Symbol(
+                    name=title,
+                    type=symbol_type,
+                    lines=(start_line, end_line),
+                    signature=None,
+                    docstring=self._extract_first_paragraph(lines, start_line, end_line),
+                    children=tuple(children),
+                )
             )
-
-            if level == 2:
-                # H2: Add to root symbols and track for children
-                symbols.append(symbol)
-                h2_stack = [symbol]
-                h3_stack = []
-            elif level == 3:
-                if h2_stack:
-                    # H3: Add as child of most recent H2
-                    h2_stack[-1].children.append(symbol)
-                    h3_stack = [symbol]
-                else:
-                    # Orphan H3 - add to root
-                    symbols.append(symbol)
-                    h3_stack = [symbol]
-            elif level == 4:
-                if h3_stack:
-                    # H4: Add as child of most recent H3
-                    h3_stack[-1].children.append(symbol)
-                elif h2_stack:
-                    # No H3 parent, add to H2
-                    h2_stack[-1].children.append(symbol)
-                else:
-                    # Orphan H4 - add to root
-                    symbols.append(symbol)
-
-        return symbols
+        return symbols, i
 
     def _extract_first_paragraph(
         self, lines: list[str], start_line: int, end_line: int
@@ -72,24 +72,16 @@ class PHPParser(TreeSitterParser):
     extensions = [".php", ".phtml"]
     language = "php"
 
-    def __init__(self):
-        """Initialize the PHP parser with the php_only grammar."""
-        from .base import Parser
+    def _load_grammar(self):
+        """Load the php_only grammar (pure PHP files, no HTML interpolation)."""
+        from tree_sitter import Language
 
         try:
-            from tree_sitter import Language, Parser as TSParser
-        except ImportError:
-            raise ImportError(
-                "tree-sitter and tree-sitter-php are required. "
-                "Install with: pip install tree-sitter tree-sitter-php"
-            )
-
-        try:
-            # Use php_only grammar for pure PHP files (no HTML interpolation)
             from tree_sitter_php import language_php
-            self._parser = TSParser(Language(language_php()))
         except ImportError:
             raise ImportError(
                 "tree-sitter-php is required. "
                 "Install with: pip install tree-sitter-php"
             )
+
+        return Language(language_php())
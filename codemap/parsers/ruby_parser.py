@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 from .base import Symbol
 from .treesitter_base import TreeSitterParser, LanguageConfig, NodeMapping
 
@@ -45,39 +47,61 @@ class RubyParser(TreeSitterParser):
 
     config = RUBY_CONFIG
 
+    def __init__(self):
+        super().__init__()
+        # Kind ids for the child-classification hot loop (int compares
+        # instead of node.type string creation).
+        self._singleton_class_id = self._language.id_for_node_kind("singleton_class", True)
+        self._body_statement_id = self._language.id_for_node_kind("body_statement", True)
+        self._method_id = self._language.id_for_node_kind("method", True)
+
     def _extract_children(self, body_node, source_bytes: bytes) -> list[Symbol]:
         """Extract child symbols from a body node.
 
         Override to handle singleton_class (class << self) blocks.
         Methods defined inside singleton_class are extracted as singleton_methods.
         """
-        children = []
-        for child in body_node.children:
-            if child.type in self.config.node_mappings:
-                symbol = self._extract_symbol(child, source_bytes)
+        children: list[Symbol] = []
+        mappings = self._kind_id_mappings
+        singleton_id = self._singleton_class_id
+        # Cursor sibling walk: body_node.children would materialize a list
+        # of Node wrappers per body, the cursor steps through them in place.
+        cursor = body_node.walk()
+        if not cursor.goto_first_child():
+            return children
+        while True:
+            node = cursor.node
+            kind_id = node.kind_id
+            if kind_id in mappings:
+                symbol = self._extract_symbol(node, source_bytes)
                 if symbol:
                     children.append(symbol)
-            elif child.type == "singleton_class":
-                children.extend(self._extract_singleton_class_methods(child, source_bytes))
+            elif kind_id == singleton_id:
+                children.extend(self._extract_singleton_class_methods(node, source_bytes))
+            if not cursor.goto_next_sibling():
+                break
         return children
 
     def _extract_singleton_class_methods(self, node, source_bytes: bytes) -> list[Symbol]:
         """Extract methods from a singleton_class (class << self) block."""
         methods = []
-        # Find the body_statement inside singleton_class
-        for child in node.children:
-            if child.type == "body_statement":
-                for body_child in child.children:
-                    if body_child.type == "method":
+        # One cursor walk descending into body_statement instead of nested
+        # node.children loops (each .children access builds a fresh list).
+        cursor = node.walk()
+        if not cursor.goto_first_child():
+            return methods
+        while True:
+            if cursor.node.kind_id == self._body_statement_id and cursor.goto_first_child():
+                while True:
+                    body_child = cursor.node
+                    if body_child.kind_id == self._method_id:
                         symbol = self._extract_symbol(body_child, source_bytes)
                         if symbol:
                             # Convert method to singleton_method
-                            methods.append(Symbol(
-                                name=symbol.name,
-                                type="singleton_method",
-                                lines=symbol.lines,
-                                signature=symbol.signature,
-                                docstring=symbol.docstring,
-                                children=symbol.children,
-                            ))
+                            methods.append(replace(symbol, type="singleton_method"))
+                    if not cursor.goto_next_sibling():
+                        break
+                cursor.goto_parent()
+            if not cursor.goto_next_sibling():
+                break
         return methods
@@ -115,7 +115,7 @@ class SQLParser(TreeSitterParser):
 
         for child in node.children:
             # Handle direct mappings (e.g., create_table)
-            if child.type in self.config.node_mappings:
+            if child.type in self._mappings:
                 symbol = self._extract_symbol(child, source_bytes)
                 if symbol:
                     symbols.append(symbol)
@@ -123,7 +123,7 @@ class SQLParser(TreeSitterParser):
             elif child.type == "statement":
                 # Extract from inside statement wrapper
                 for stmt_child in child.children:
-                    if stmt_child.type in self.config.node_mappings:
+                    if stmt_child.type in self._mappings:
                         symbol = self._extract_symbol(stmt_child, source_bytes)
                         if symbol:
                             symbols.append(symbol)
@@ -159,7 +159,7 @@ class SQLParser(TreeSitterParser):
         """
         children = []
         for child in body_node.children:
-            if child.type in self.config.node_mappings:
+            if child.type in self._mappings:
                 symbol = self._extract_symbol(child, source_bytes)
                 if symbol:
                     children.append(symbol)
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
+import mmap
+import threading
 from abc import abstractmethod
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from typing import Optional, Callable
 
 from .base import Parser, Symbol
@@ -17,6 +21,24 @@ except ImportError:
     TSParser = None
     Node = None
 
+# Language objects are immutable and shareable; cache one per grammar
+# module so repeated parser construction doesn't reload the grammar.
+_LANGUAGE_CACHE: dict[str, "Language"] = {}
+
+# Parse results memoized per parser instance, keyed by content digest
+_PARSE_CACHE_SIZE = 128
+
+
+def _load_language(grammar_module: str) -> "Language":
+    """Load (or fetch the cached) Language for a grammar module."""
+    language = _LANGUAGE_CACHE.get(grammar_module)
+    if language is None:
+        import importlib
+        grammar = importlib.import_module(f"tree_sitter_{grammar_module}")
+        language = Language(grammar.language())
+        _LANGUAGE_CACHE[grammar_module] = language
+    return language
+
 
 @dataclass
 class NodeMapping:
@@ -68,10 +90,58 @@ class TreeSitterParser(Parser):
                 f"Install with: pip install tree-sitter tree-sitter-{self.config.name}"
             )
 
-        # Dynamically import the grammar module
-        import importlib
-        grammar = importlib.import_module(f"tree_sitter_{self.config.grammar_module}")
-        self._parser = TSParser(Language(grammar.language()))
+        self._language = self._load_grammar()
+        # TSParser objects are not thread-safe but are cheap; keep one
+        # per thread, created lazily on first parse.
+        self._local = threading.local()
+
+        # Snapshot hot config fields onto the instance; the extraction loops
+        # touch these once per AST node and the attribute chain through
+        # self.config adds up.
+        config = self.config
+        self._mappings = config.node_mappings
+        self._export_wrappers = frozenset(config.export_wrappers)
+        self._container_types = frozenset(config.container_types)
+        self._comment_types = frozenset(config.comment_types)
+
+        # Integer kind-id variants of the hot lookups: node.kind_id is a C
+        # int, so hashing it skips the per-node node.type string creation
+        # entirely in the traversal loops.
+        language = self._language
+        self._kind_id_mappings = {
+            kind_id: mapping
+            for name, mapping in self._mappings.items()
+            if (kind_id := language.id_for_node_kind(name, True))
+        }
+        self._wrapper_kind_ids = self._kind_ids_for(config.export_wrappers)
+        self._container_kind_ids = self._kind_ids_for(config.container_types)
+
+        # LRU of recent parse results keyed by content digest; Symbols are
+        # frozen so cached trees can be shared between callers.
+        self._parse_cache: OrderedDict[bytes, tuple[Symbol, ...]] = OrderedDict()
+
+    def _kind_ids_for(self, names: list[str]) -> frozenset[int]:
+        """Map node type names to this grammar's kind ids, dropping unknowns."""
+        language = self._language
+        return frozenset(
+            kind_id for name in names
+            if (kind_id := language.id_for_node_kind(name, True))
+        )
+
+    def _load_grammar(self) -> "Language":
+        """Load this parser's Language.
+
+        Subclasses with custom grammar entry points override this.
+        """
+        return _load_language(self.config.grammar_module)
+
+    @property
+    def _parser(self) -> "TSParser":
+        """This thread's TSParser, created lazily."""
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = TSParser(self._language)
+        return parser
 
     @property
     def extensions(self) -> list[str]:
@@ -83,34 +153,76 @@ class TreeSitterParser(Parser):
 
     def parse(self, source: str, filepath: str = "") -> list[Symbol]:
         """Parse source code and extract symbols."""
-        source_bytes = source.encode("utf-8")
+        return self._parse_bytes(source.encode("utf-8"))
+
+    def _parse_bytes(self, source_bytes) -> list[Symbol]:
+        """Parse already-encoded source bytes and extract symbols.
+
+        Accepts any bytes-like object (including an mmap). Subclasses that
+        preprocess the source at the bytes level can call this directly to
+        avoid a redundant encode pass.
+
+        Results are memoized by content digest: watch mode and repeated
+        update calls often re-parse identical bytes, and hashing is orders
+        of magnitude cheaper than a tree-sitter parse plus extraction.
+        """
+        cache = self._parse_cache
+        digest = hashlib.sha256(source_bytes).digest()
+        cached = cache.get(digest)
+        if cached is not None:
+            cache.move_to_end(digest)
+            return list(cached)
+
         tree = self._parser.parse(source_bytes)
-        return self._extract_symbols(tree.root_node, source_bytes)
+        symbols = self._extract_symbols(tree.root_node, source_bytes)
+        cache[digest] = tuple(symbols)
+        if len(cache) > _PARSE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return symbols
+
+    def parse_file(self, filepath) -> list[Symbol]:
+        """Parse a source file by mmapping it.
+
+        tree-sitter accepts any buffer object, so the mapped region is fed
+        to the parser without first copying the file into a bytes object.
+        Empty files (which cannot be mmapped) fall back to a plain read.
+        """
+        with open(filepath, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return self._parse_bytes(f.read())
+            with mapped:
+                return self._parse_bytes(mapped)
 
     def _extract_symbols(self, node: "Node", source_bytes: bytes) -> list[Symbol]:
         """Extract symbols from AST node."""
         symbols = []
+        mappings = self._kind_id_mappings
+        wrappers = self._wrapper_kind_ids
+        containers = self._container_kind_ids
 
         for child in node.children:
+            kind_id = child.kind_id
             # Check if this is a mapped node type
-            if child.type in self.config.node_mappings:
+            if kind_id in mappings:
                 symbol = self._extract_symbol(child, source_bytes)
                 if symbol:
                     symbols.append(symbol)
 
             # Check for export wrappers
-            elif child.type in self.config.export_wrappers:
+            elif kind_id in wrappers:
                 symbols.extend(self._extract_from_wrapper(child, source_bytes))
 
             # Recursively traverse container types (e.g., C# namespaces)
-            elif child.type in self.config.container_types:
+            elif kind_id in containers:
                 symbols.extend(self._extract_symbols(child, source_bytes))
 
         return symbols
 
     def _extract_symbol(self, node: "Node", source_bytes: bytes) -> Optional[Symbol]:
         """Extract a symbol from a node using the mapping configuration."""
-        mapping = self.config.node_mappings.get(node.type)
+        mapping = self._mappings.get(node.type)
         if not mapping:
             return None
 
@@ -178,8 +290,10 @@ class TreeSitterParser(Parser):
 
     def _extract_docstring(self, node: "Node", source_bytes: bytes) -> Optional[str]:
         """Extract docstring from preceding comment."""
-        if node.prev_sibling and node.prev_sibling.type in self.config.comment_types:
-            comment = self._get_node_text(node.prev_sibling, source_bytes)
+        # Bind prev_sibling once; each access allocates a fresh Node wrapper.
+        prev = node.prev_sibling
+        if prev is not None and prev.type in self._comment_types:
+            comment = self._get_node_text(prev, source_bytes)
             return self._clean_comment(comment)
         return None
 
@@ -211,37 +325,26 @@ class TreeSitterParser(Parser):
     def _extract_children(self, body_node: "Node", source_bytes: bytes) -> list[Symbol]:
         """Extract child symbols from a body node."""
         children = []
+        mappings = self._kind_id_mappings
         for child in body_node.children:
-            if child.type in self.config.node_mappings:
+            if child.kind_id in mappings:
                 symbol = self._extract_symbol(child, source_bytes)
                 if symbol:
-                    # Convert function to method if inside a class
+                    # Convert function to method if inside a class; only
+                    # reallocate when the type actually changes.
                     if symbol.type == "function":
-                        symbol = Symbol(
-                            name=symbol.name,
-                            type="method",
-                            lines=symbol.lines,
-                            signature=symbol.signature,
-                            docstring=symbol.docstring,
-                            children=symbol.children,
-                        )
+                        symbol = replace(symbol, type="method")
                     elif symbol.type == "async_function":
-                        symbol = Symbol(
-                            name=symbol.name,
-                            type="async_method",
-                            lines=symbol.lines,
-                            signature=symbol.signature,
-                            docstring=symbol.docstring,
-                            children=symbol.children,
-                        )
+                        symbol = replace(symbol, type="async_method")
                     children.append(symbol)
         return children
 
     def _extract_from_wrapper(self, node: "Node", source_bytes: bytes) -> list[Symbol]:
         """Extract symbols from wrapper nodes like export statements."""
         symbols = []
+        mappings = self._kind_id_mappings
         for child in node.children:
-            if child.type in self.config.node_mappings:
+            if child.kind_id in mappings:
                 symbol = self._extract_symbol(child, source_bytes)
                 if symbol:
                     symbols.append(symbol)
@@ -258,4 +361,10 @@ class TreeSitterParser(Parser):
         """Get the text content of a node."""
         if node is None:
             return ""
-        return source_bytes[node.start_byte:node.end_byte].decode("utf-8")
+        chunk = source_bytes[node.start_byte:node.end_byte]
+        try:
+            # Fast path: most identifiers are ASCII, which skips the UTF-8
+            # validation state machine entirely.
+            return chunk.decode("ascii")
+        except UnicodeDecodeError:
+            return chunk.decode("utf-8")
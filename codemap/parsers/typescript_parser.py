@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import re
+import threading
+from typing import Iterator, Optional
 
 from .base import Parser, Symbol
 
@@ -17,6 +19,25 @@ except ImportError:
     TSParser = None
     Node = None
 
+# JSDoc cleanup: strip leading "* " prefixes, then drop @tag lines. Two
+# C-level regex passes instead of a per-line Python loop.
+_JSDOC_STRIP_RE = re.compile(r"(?m)^[ \t]*\*[ \t]?")
+_JSDOC_AT_LINE_RE = re.compile(r"(?m)^[ \t]*@.*$")
+
+# Language objects are immutable and safe to share; build each once per
+# process instead of once per parser instance.
+_TS_LANGUAGE: Optional["Language"] = None
+_TSX_LANGUAGE: Optional["Language"] = None
+
+
+def _get_languages() -> tuple["Language", "Language"]:
+    """Return the shared (typescript, tsx) Language pair, creating lazily."""
+    global _TS_LANGUAGE, _TSX_LANGUAGE
+    if _TS_LANGUAGE is None:
+        _TS_LANGUAGE = Language(tsts.language_typescript())
+        _TSX_LANGUAGE = Language(tsts.language_tsx())
+    return _TS_LANGUAGE, _TSX_LANGUAGE
+
 
 class TypeScriptParser(Parser):
     """Parser for TypeScript files using tree-sitter."""
@@ -32,8 +53,23 @@ class TypeScriptParser(Parser):
                 "Install with: pip install tree-sitter tree-sitter-typescript"
             )
         # Use TypeScript language for .ts files, TSX for .tsx
-        self._ts_parser = TSParser(Language(tsts.language_typescript()))
-        self._tsx_parser = TSParser(Language(tsts.language_tsx()))
+        self._ts_language, self._tsx_language = _get_languages()
+        # TSParser objects are not thread-safe but are cheap; keep one
+        # per thread, created lazily on first parse.
+        self._local = threading.local()
+
+    def _get_parser(self, filepath: str) -> "TSParser":
+        """Return this thread's TSParser for the given file extension."""
+        local = self._local
+        if filepath.endswith(".tsx"):
+            parser = getattr(local, "tsx_parser", None)
+            if parser is None:
+                parser = local.tsx_parser = TSParser(self._tsx_language)
+        else:
+            parser = getattr(local, "ts_parser", None)
+            if parser is None:
+                parser = local.ts_parser = TSParser(self._ts_language)
+        return parser
 
     def parse(self, source: str, filepath: str = "") -> list[Symbol]:
         """Parse TypeScript source code and extract symbols.
@@ -46,41 +82,71 @@ class TypeScriptParser(Parser):
             List of top-level Symbol objects.
         """
         # Choose parser based on file extension
-        parser = self._tsx_parser if filepath.endswith(".tsx") else self._ts_parser
+        parser = self._get_parser(filepath)
 
         # Convert to bytes for tree-sitter (it uses byte offsets)
         source_bytes = source.encode("utf-8")
         tree = parser.parse(source_bytes)
-        return self._extract_symbols(tree.root_node, source_bytes)
+        return list(self._iter_symbols(tree.root_node, source_bytes))
+
+    def parse_file(self, filepath) -> list[Symbol]:
+        """Parse a TypeScript file by mmapping it.
+
+        tree-sitter accepts any buffer object, so the mapped region is fed
+        to the parser without first copying the file into a bytes object.
+        Empty files (which cannot be mmapped) fall back to a plain read.
+        """
+        import mmap
+
+        path_str = str(filepath)
+        parser = self._get_parser(path_str)
+        with open(filepath, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                source_bytes = f.read()
+                tree = parser.parse(source_bytes)
+                return list(self._iter_symbols(tree.root_node, source_bytes))
+            with mapped:
+                tree = parser.parse(mapped)
+                return list(self._iter_symbols(tree.root_node, mapped))
 
     # Node types that contain symbols but aren't symbols themselves.
-    _container_types = {"ambient_declaration", "internal_module", "module", "statement_block"}
+    _container_types = frozenset({"ambient_declaration", "internal_module", "module", "statement_block"})
+
+    def _iter_symbols(self, node: "Node", source_bytes: bytes) -> Iterator[Symbol]:
+        """Yield symbols from a tree-sitter AST.
 
-    def _extract_symbols(self, node: "Node", source_bytes: bytes) -> list[Symbol]:
-        """Extract symbols from tree-sitter AST.
+        Generator form avoids the intermediate lists the old list-building
+        traversal allocated at every recursion level; the single result list
+        is built once at the parse() boundary.
 
         Args:
             node: Tree-sitter node.
             source_bytes: Original source code as bytes.
 
-        Returns:
-            List of Symbol objects.
+        Yields:
+            Symbol objects in source order.
         """
-        symbols = []
-
-        for child in node.children:
-            parsed = self._parse_node(child, source_bytes)
-            if parsed:
-                symbols.extend(parsed) if isinstance(parsed, list) else symbols.append(parsed)
-            elif child.type == "export_statement":
-                exported = self._parse_export(child, source_bytes)
-                if exported:
-                    symbols.extend(exported)
-            elif child.type in self._container_types:
-                # Recurse into ambient declarations, namespaces, modules
-                symbols.extend(self._extract_symbols(child, source_bytes))
-
-        return symbols
+        # Walk children with a cursor to avoid materializing node.children.
+        cursor = node.walk()
+        if cursor.goto_first_child():
+            while True:
+                child = cursor.node
+                child_type = child.type
+                parsed = self._parse_node(child, source_bytes)
+                if parsed:
+                    if isinstance(parsed, list):
+                        yield from parsed
+                    else:
+                        yield parsed
+                elif child_type == "export_statement":
+                    yield from self._iter_export(child, source_bytes)
+                elif child_type in self._container_types:
+                    # Recurse into ambient declarations, namespaces, modules
+                    yield from self._iter_symbols(child, source_bytes)
+                if not cursor.goto_next_sibling():
+                    break
 
     def _parse_node(self, node: "Node", source_bytes: bytes) -> Optional[Symbol]:
         """Parse a single node into a Symbol.
@@ -92,38 +158,37 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol or None if not a recognized symbol type.
         """
-        if node.type in ("class_declaration", "abstract_class_declaration"):
-            return self._parse_class(node, source_bytes)
-        elif node.type in ("function_declaration", "function_signature"):
-            return self._parse_function(node, source_bytes, "function")
-        elif node.type in ("lexical_declaration", "variable_declaration"):
-            return self._parse_lexical_declaration(node, source_bytes)
-        elif node.type == "interface_declaration":
-            return self._parse_interface(node, source_bytes)
-        elif node.type == "type_alias_declaration":
-            return self._parse_type_alias(node, source_bytes)
-        elif node.type == "enum_declaration":
-            return self._parse_enum(node, source_bytes)
-        return None
+        handler = self._node_handlers.get(node.type)
+        return handler(self, node, source_bytes) if handler else None
 
-    def _parse_export(self, node: "Node", source_bytes: bytes) -> list[Symbol]:
-        """Parse an export statement.
+    def _iter_export(self, node: "Node", source_bytes: bytes) -> Iterator[Symbol]:
+        """Yield symbols from an export statement.
 
         Args:
             node: Export statement node.
             source_bytes: Original source code as bytes.
 
-        Returns:
-            List of exported symbols.
+        Yields:
+            Exported symbols.
         """
-        symbols = []
-        for child in node.children:
-            parsed = self._parse_node(child, source_bytes)
-            if parsed:
-                symbols.extend(parsed) if isinstance(parsed, list) else symbols.append(parsed)
-            elif child.type in self._container_types:
-                symbols.extend(self._extract_symbols(child, source_bytes))
-        return symbols
+        cursor = node.walk()
+        if cursor.goto_first_child():
+            while True:
+                child = cursor.node
+                parsed = self._parse_node(child, source_bytes)
+                if parsed:
+                    if isinstance(parsed, list):
+                        yield from parsed
+                    else:
+                        yield parsed
+                elif child.type in self._container_types:
+                    yield from self._iter_symbols(child, source_bytes)
+                if not cursor.goto_next_sibling():
+                    break
+
+    def _parse_function_declaration(self, node: "Node", source_bytes: bytes) -> Symbol:
+        """Parse a top-level function declaration (dispatch shim)."""
+        return self._parse_function(node, source_bytes, "function")
 
     def _parse_class(self, node: "Node", source_bytes: bytes) -> Symbol:
         """Parse a class declaration.
@@ -135,17 +200,20 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the class.
         """
-        name = self._get_node_text(self._find_child(node, "type_identifier"), source_bytes)
-        if not name:
-            name = self._get_node_text(self._find_child(node, "identifier"), source_bytes)
+        # Grammar fields resolve at the C layer without scanning children
+        name = self._get_node_text(node.child_by_field_name("name"), source_bytes)
 
         children = []
-        body = self._find_child(node, "class_body")
+        body = node.child_by_field_name("body")
         if body:
-            for member in body.children:
-                child_symbol = self._parse_class_member(member, source_bytes)
-                if child_symbol:
-                    children.append(child_symbol)
+            cursor = body.walk()
+            if cursor.goto_first_child():
+                while True:
+                    child_symbol = self._parse_class_member(cursor.node, source_bytes)
+                    if child_symbol:
+                        children.append(child_symbol)
+                    if not cursor.goto_next_sibling():
+                        break
 
         return Symbol(
             name=name or "<anonymous>",
@@ -165,14 +233,8 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol or None.
         """
-        if node.type == "method_definition":
-            return self._parse_method(node, source_bytes)
-        elif node.type == "abstract_method_signature":
-            return self._parse_abstract_method(node, source_bytes)
-        elif node.type == "public_field_definition":
-            # Extract arrow functions assigned to class properties
-            return self._parse_field_arrow_function(node, source_bytes)
-        return None
+        handler = self._class_member_handlers.get(node.type)
+        return handler(self, node, source_bytes) if handler else None
 
     def _parse_method(self, node: "Node", source_bytes: bytes) -> Symbol:
         """Parse a method definition.
@@ -184,11 +246,11 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the method.
         """
-        name_node = self._find_child(node, "property_identifier")
+        name_node = node.child_by_field_name("name")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
 
         # Check if async
-        is_async = any(c.type == "async" for c in node.children)
+        is_async = self._is_async(node)
         symbol_type = "async_method" if is_async else "method"
 
         signature = self._get_function_signature(node, source_bytes)
@@ -203,7 +265,7 @@ class TypeScriptParser(Parser):
 
     def _parse_abstract_method(self, node: "Node", source_bytes: bytes) -> Symbol:
         """Parse an abstract method signature."""
-        name_node = self._find_child(node, "property_identifier")
+        name_node = node.child_by_field_name("name")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
         signature = self._get_function_signature(node, source_bytes)
         return Symbol(
@@ -216,12 +278,12 @@ class TypeScriptParser(Parser):
 
     def _parse_field_arrow_function(self, node: "Node", source_bytes: bytes) -> Optional[Symbol]:
         """Parse a class field that is an arrow function."""
-        name_node = self._find_child(node, "property_identifier")
-        arrow_node = self._find_child(node, "arrow_function")
-        if not (name_node and arrow_node):
+        name_node = node.child_by_field_name("name")
+        arrow_node = node.child_by_field_name("value")
+        if not (name_node and arrow_node) or arrow_node.type != "arrow_function":
             return None
         name = self._get_node_text(name_node, source_bytes)
-        is_async = any(c.type == "async" for c in arrow_node.children)
+        is_async = self._is_async(arrow_node)
         symbol_type = "async_method" if is_async else "method"
         signature = self._get_arrow_signature(arrow_node, source_bytes)
         return Symbol(
@@ -243,11 +305,11 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the function.
         """
-        name_node = self._find_child(node, "identifier")
+        name_node = node.child_by_field_name("name")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
 
         # Check if async
-        is_async = any(c.type == "async" for c in node.children)
+        is_async = self._is_async(node)
         symbol_type = f"async_{base_type}" if is_async else base_type
 
         signature = self._get_function_signature(node, source_bytes)
@@ -271,37 +333,73 @@ class TypeScriptParser(Parser):
             List of Symbols for named arrow functions found.
         """
         symbols = []
-        for child in node.children:
-            if child.type == "variable_declarator":
-                name_node = self._find_child(child, "identifier")
-                value_node = None
-                for c in child.children:
-                    if c.type == "arrow_function":
-                        value_node = c
-                        break
-                    # Handle: const fn: Type = () => {} (function_expression too)
-                    if c.type == "as_expression":
-                        for cc in c.children:
-                            if cc.type == "arrow_function":
-                                value_node = cc
-                                break
-
-                if name_node and value_node:
-                    name = self._get_node_text(name_node, source_bytes)
-                    is_async = any(c.type == "async" for c in value_node.children)
-                    symbol_type = "async_function" if is_async else "function"
-
-                    signature = self._get_arrow_signature(value_node, source_bytes)
-
-                    symbols.append(Symbol(
-                        name=name or "<anonymous>",
-                        type=symbol_type,
-                        lines=(node.start_point[0] + 1, node.end_point[0] + 1),
-                        signature=signature,
-                        docstring=self._get_preceding_comment(node, source_bytes),
-                    ))
+        # The statement's lines and preceding comment are shared by every
+        # declarator it contains; compute them at most once.
+        lines = None
+        docstring = None
+        cursor = node.walk()
+        if cursor.goto_first_child():
+            while True:
+                child = cursor.node
+                if child.type == "variable_declarator":
+                    name_node, value_node = self._find_arrow_in_declarator(child)
+
+                    if name_node and value_node:
+                        if lines is None:
+                            lines = (node.start_point[0] + 1, node.end_point[0] + 1)
+                            docstring = self._get_preceding_comment(node, source_bytes)
+                        name = self._get_node_text(name_node, source_bytes)
+                        is_async = self._is_async(value_node)
+                        symbol_type = "async_function" if is_async else "function"
+
+                        signature = self._get_arrow_signature(value_node, source_bytes)
+
+                        symbols.append(Symbol(
+                            name=name or "<anonymous>",
+                            type=symbol_type,
+                            lines=lines,
+                            signature=signature,
+                            docstring=docstring,
+                        ))
+                if not cursor.goto_next_sibling():
+                    break
         return symbols
 
+    def _find_arrow_in_declarator(self, decl_node: "Node") -> tuple[Optional["Node"], Optional["Node"]]:
+        """Locate the name and arrow function inside a variable_declarator.
+
+        Uses the grammar's name/value fields; handles both a direct arrow
+        function value and one wrapped in an as_expression
+        (const fn = (() => {}) as Type).
+
+        Args:
+            decl_node: Variable declarator node.
+
+        Returns:
+            (name_node, arrow_node) pair; either may be None.
+        """
+        name_node = decl_node.child_by_field_name("name")
+        if name_node is not None and name_node.type != "identifier":
+            # Destructuring patterns are not named arrow functions
+            name_node = None
+
+        arrow_node = None
+        value_node = decl_node.child_by_field_name("value")
+        if value_node is not None:
+            value_type = value_node.type
+            if value_type == "arrow_function":
+                arrow_node = value_node
+            elif value_type == "as_expression":
+                cursor = value_node.walk()
+                if cursor.goto_first_child():
+                    while True:
+                        if cursor.node.type == "arrow_function":
+                            arrow_node = cursor.node
+                            break
+                        if not cursor.goto_next_sibling():
+                            break
+        return name_node, arrow_node
+
     def _parse_interface(self, node: "Node", source_bytes: bytes) -> Symbol:
         """Parse an interface declaration.
 
@@ -312,7 +410,7 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the interface.
         """
-        name_node = self._find_child(node, "type_identifier")
+        name_node = node.child_by_field_name("name")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
 
         return Symbol(
@@ -332,7 +430,7 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the type alias.
         """
-        name_node = self._find_child(node, "type_identifier")
+        name_node = node.child_by_field_name("name")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
 
         return Symbol(
@@ -352,7 +450,7 @@ class TypeScriptParser(Parser):
         Returns:
             Symbol representing the enum.
         """
-        name_node = self._find_child(node, "identifier")
+        name_node = node.child_by_field_name("name")
         name = self._get_node_text(name_node, source_bytes) if name_node else "<anonymous>"
 
         return Symbol(
@@ -362,6 +460,28 @@ class TypeScriptParser(Parser):
             docstring=self._get_preceding_comment(node, source_bytes),
         )
 
+    # Dispatch tables mapping node.type to a handler. Built once at class
+    # creation so the per-node hot path is a single dict lookup instead of
+    # an if/elif chain of string comparisons.
+    _node_handlers = {
+        "class_declaration": _parse_class,
+        "abstract_class_declaration": _parse_class,
+        "function_declaration": _parse_function_declaration,
+        "function_signature": _parse_function_declaration,
+        "lexical_declaration": _parse_lexical_declaration,
+        "variable_declaration": _parse_lexical_declaration,
+        "interface_declaration": _parse_interface,
+        "type_alias_declaration": _parse_type_alias,
+        "enum_declaration": _parse_enum,
+    }
+
+    _class_member_handlers = {
+        "method_definition": _parse_method,
+        "abstract_method_signature": _parse_abstract_method,
+        # Extract arrow functions assigned to class properties
+        "public_field_definition": _parse_field_arrow_function,
+    }
+
     def _get_function_signature(self, node: "Node", source_bytes: bytes) -> str:
         """Extract function signature from a function/method node.
 
@@ -372,18 +492,14 @@ class TypeScriptParser(Parser):
         Returns:
             Signature string.
         """
-        params_node = self._find_child(node, "formal_parameters")
+        params_node = node.child_by_field_name("parameters")
         if not params_node:
             return "()"
 
         params_text = self._get_node_text(params_node, source_bytes)
 
         # Get return type if present
-        return_type = ""
-        for child in node.children:
-            if child.type == "type_annotation":
-                return_type = self._get_node_text(child, source_bytes)
-                break
+        return_type = self._get_node_text(node.child_by_field_name("return_type"), source_bytes)
 
         sig = params_text or "()"
         if return_type:
@@ -401,20 +517,16 @@ class TypeScriptParser(Parser):
         Returns:
             Signature string.
         """
-        params_node = self._find_child(node, "formal_parameters")
+        params_node = node.child_by_field_name("parameters")
         if params_node:
             params_text = self._get_node_text(params_node, source_bytes)
         else:
             # Single parameter without parens
-            param_node = self._find_child(node, "identifier")
+            param_node = node.child_by_field_name("parameter")
             params_text = f"({self._get_node_text(param_node, source_bytes)})" if param_node else "()"
 
         # Get return type if present
-        return_type = ""
-        for child in node.children:
-            if child.type == "type_annotation":
-                return_type = self._get_node_text(child, source_bytes)
-                break
+        return_type = self._get_node_text(node.child_by_field_name("return_type"), source_bytes)
 
         sig = params_text
         if return_type:
@@ -422,20 +534,20 @@ class TypeScriptParser(Parser):
 
         return sig
 
-    def _find_child(self, node: "Node", child_type: str) -> Optional["Node"]:
-        """Find a child node by type.
+    def _is_async(self, node: "Node") -> bool:
+        """Check for an ``async`` keyword child without building node.children.
 
-        Args:
-            node: Parent node.
-            child_type: Type of child to find.
-
-        Returns:
-            Child node or None.
+        The keyword is almost always the first child, so the cursor walk
+        short-circuits immediately on async functions.
         """
-        for child in node.children:
-            if child.type == child_type:
-                return child
-        return None
+        cursor = node.walk()
+        if cursor.goto_first_child():
+            while True:
+                if cursor.node.type == "async":
+                    return True
+                if not cursor.goto_next_sibling():
+                    break
+        return False
 
     def _get_node_text(self, node: Optional["Node"], source_bytes: bytes) -> str:
         """Get the text content of a node.
@@ -449,7 +561,13 @@ class TypeScriptParser(Parser):
         """
         if node is None:
             return ""
-        return source_bytes[node.start_byte:node.end_byte].decode("utf-8")
+        chunk = source_bytes[node.start_byte:node.end_byte]
+        try:
+            # Fast path: most identifiers are ASCII, which skips the UTF-8
+            # validation state machine entirely.
+            return chunk.decode("ascii")
+        except UnicodeDecodeError:
+            return chunk.decode("utf-8")
 
     def _get_preceding_comment(self, node: "Node", source_bytes: bytes) -> Optional[str]:
         """Get JSDoc comment preceding a node.
@@ -461,22 +579,17 @@ class TypeScriptParser(Parser):
         Returns:
             Comment text or None.
         """
-        # Look for comment in preceding siblings
-        if node.prev_sibling and node.prev_sibling.type == "comment":
-            comment = self._get_node_text(node.prev_sibling, source_bytes)
+        # Look for comment in preceding siblings; bind prev_sibling once,
+        # each access allocates a fresh Node wrapper.
+        prev = node.prev_sibling
+        if prev is not None and prev.type == "comment":
+            comment = self._get_node_text(prev, source_bytes)
             # Clean up JSDoc comment
             if comment.startswith("/**"):
-                comment = comment[3:-2].strip()
-                # Remove leading * from lines
-                lines = comment.split("\n")
-                cleaned = []
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("*"):
-                        line = line[1:].strip()
-                    if line and not line.startswith("@"):
-                        cleaned.append(line)
-                return " ".join(cleaned) if cleaned else None
+                inner = _JSDOC_STRIP_RE.sub("", comment[3:-2])
+                inner = _JSDOC_AT_LINE_RE.sub("", inner)
+                cleaned = " ".join(inner.split())
+                return cleaned or None
             elif comment.startswith("//"):
                 return comment[2:].strip()
         return None
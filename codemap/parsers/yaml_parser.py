@@ -60,53 +60,61 @@ class YamlParser(Parser):
         lines: list[str],
         total_lines: int,
     ) -> list[Symbol]:
-        """Build a hierarchical symbol tree from flat key list."""
+        """Build a hierarchical symbol tree from flat key list.
+
+        Recursive descent over the flat key list: a key's children are the
+        following keys with deeper indentation, ending at the next key at
+        the same or a shallower indent. Built bottom-up so each Symbol's
+        children tuple is complete before the Symbol is constructed.
+        """
         if not keys:
             return []
 
-        symbols: list[Symbol] = []
-        # Stack of (indent, symbol) for tracking hierarchy
-        stack: list[tuple[int, Symbol]] = []
-
-        for i, (indent, name, start_line, is_list_item) in enumerate(keys):
-            # Find end line (next key at same or lower indent, or EOF)
+        # Precompute end lines (next key at same or lower indent, or EOF)
+        ends = []
+        for i, (indent, _, _, _) in enumerate(keys):
             end_line = total_lines
             for j in range(i + 1, len(keys)):
                 next_indent, _, next_line, _ = keys[j]
                 if next_indent <= indent:
                     end_line = next_line - 1
                     break
+            ends.append(end_line)
 
-            # Determine symbol type
-            symbol_type = self._determine_type(lines, start_line, end_line, is_list_item)
+        symbols, _ = self._build_subtree(keys, ends, lines, 0, -1)
+        return symbols
 
-            # Extract value preview as docstring
-            docstring = self._extract_value_preview(lines, start_line)
+    def _build_subtree(
+        self,
+        keys: list[tuple[int, str, int, bool]],
+        ends: list[int],
+        lines: list[str],
+        start: int,
+        parent_indent: int,
+    ) -> tuple[list[Symbol], int]:
+        """Build symbols from keys indented deeper than parent_indent.
 
-            symbol = Symbol(
-                name=name,
-                type=symbol_type,
-                lines=(start_line, end_line),
-                signature=None,
-                docstring=docstring,
-                children=[],
+        Returns:
+            (symbols, index of the first unconsumed key).
+        """
+        symbols: list[Symbol] = []
+        i = start
+        while i < len(keys) and keys[i][0] > parent_indent:
+            indent, name, start_line, is_list_item = keys[i]
+            end_line = ends[i]
+            children, i = self._build_subtree(keys, ends, lines, i + 1, indent)
+
+            symbols.append(
+                Symbol(
+                    name=name,
+                    type=self._determine_type(lines, start_line, end_line, is_list_item),
+                    lines=(start_line, end_line),
+                    signature=None,
+                    docstring=self._extract_value_preview(lines, start_line),
+                    children=tuple(children),
+                )
             )
-
-            # Pop stack until we find parent (lower indent)
-            while stack and stack[-1][0] >= indent:
-                stack.pop()
-
-            if stack:
-                # Add as child of parent
-                stack[-1][1].children.append(symbol)
-            else:
-                # Root level symbol
-                symbols.append(symbol)
-
-            # Push current symbol to stack
-            stack.append((indent, symbol))
-
-        return symbols
+        return symbols, i
 
     def _determine_type(
         self, lines: list[str], start_line: int, end_line: int, is_list_item: bool
@@ -0,0 +1,41 @@
+"""Shared pytest configuration for the CodeMap test suite."""
+
+import importlib.util
+
+import pytest
+
+from codemap.utils.config import Config
+
+# Grammar availability, probed once per session. The parser test modules
+# used to call pytest.importorskip at import time, which repeats the same
+# sys.path scan for every module; find_spec here records each answer once
+# and the modules just consult the map.
+_GRAMMAR_MODULES = (
+    "tree_sitter_c",
+    "tree_sitter_c_sharp",
+    "tree_sitter_cpp",
+    "tree_sitter_go",
+    "tree_sitter_java",
+    "tree_sitter_kotlin",
+    "tree_sitter_language_pack",
+    "tree_sitter_php",
+    "tree_sitter_ruby",
+    "tree_sitter_rust",
+    "tree_sitter_sql",
+    "tree_sitter_swift",
+)
+
+AVAILABLE = {
+    name: importlib.util.find_spec(name) is not None
+    for name in _GRAMMAR_MODULES
+}
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """One default Config shared by tests that only read it.
+
+    Config cannot be frozen (Indexer mutates its languages and
+    exclude_patterns), so tests that modify a config must build their own.
+    """
+    return Config()
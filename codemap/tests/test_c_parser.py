@@ -1,133 +1,76 @@
 """Tests for the C parser."""
 
-import os
+from pathlib import Path
 
 import pytest
 
-# Skip all tests if tree-sitter-c is not installed
-pytest.importorskip("tree_sitter_c")
+# Skip the whole module if tree-sitter-c is not installed
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_c"]:
+    pytest.skip("tree_sitter_c not installed", allow_module_level=True)
 
 from codemap.parsers.c_parser import CParser
 
 
-class TestCParser:
-    """Tests for CParser class."""
+C_FIXTURE_PATH = Path(__file__).parent / "fixtures" / "sample_module.c"
 
-    @pytest.fixture
-    def parser(self):
-        return CParser()
 
-    def test_parse_simple_function(self, parser):
-        source = '''
+# Source snippets hoisted to module scope so each literal is built once at
+# import instead of once per test call.
+SRC_SIMPLE_FUNCTION = '''
 /* Add two numbers */
 int add(int a, int b) {
     return a + b;
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "add"
-        assert symbols[0].type == "function"
-        assert symbols[0].signature == "(int a, int b)"
 
-    def test_parse_function_with_pointer_return(self, parser):
-        source = '''
+SRC_POINTER_RETURN = '''
 /* Create an array */
 int* create_array(size_t size) {
     return NULL;
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "create_array"
-        assert symbols[0].type == "function"
-        assert symbols[0].signature == "(size_t size)"
 
-    def test_parse_void_function(self, parser):
-        source = '''
+SRC_VOID_FUNCTION = '''
 void print_hello(void) {
     printf("Hello\\n");
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "print_hello"
-        assert symbols[0].type == "function"
 
-    def test_parse_struct(self, parser):
-        source = '''
+SRC_STRUCT = '''
 /* A 2D point */
 struct Point {
     int x;
     int y;
 };
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "Point"
-        assert symbols[0].type == "struct"
-        assert "2D point" in symbols[0].docstring
 
-    def test_parse_enum(self, parser):
-        source = '''
+SRC_ENUM = '''
 /* Status codes */
 enum Status {
     OK = 0,
     ERROR = -1
 };
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "Status"
-        assert symbols[0].type == "enum"
-
-    def test_parse_typedef_primitive(self, parser):
-        source = '''
+SRC_TYPEDEF_PRIMITIVE = '''
 /* Byte type alias */
 typedef unsigned char byte;
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "byte"
-        assert symbols[0].type == "typedef"
-
-    def test_parse_typedef_enum(self, parser):
-        source = '''
+SRC_TYPEDEF_ENUM = '''
 enum Status { OK, ERROR };
 typedef enum Status StatusCode;
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 2
-        names = [s.name for s in symbols]
-        types = [s.type for s in symbols]
-        assert "Status" in names
-        assert "StatusCode" in names
-        assert "enum" in types
-        assert "typedef" in types
-
-    def test_parse_multiple_functions(self, parser):
-        source = '''
+SRC_MULTIPLE_FUNCTIONS = '''
 int add(int a, int b) { return a + b; }
 int sub(int a, int b) { return a - b; }
 int mul(int a, int b) { return a * b; }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 3
-        names = [s.name for s in symbols]
-        assert "add" in names
-        assert "sub" in names
-        assert "mul" in names
-
-    def test_parse_nested_struct(self, parser):
-        source = '''
+SRC_NESTED_STRUCT = '''
 struct Point {
     int x;
     int y;
@@ -138,55 +81,15 @@ struct Rectangle {
     struct Point bottom_right;
 };
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 2
-        names = [s.name for s in symbols]
-        assert "Point" in names
-        assert "Rectangle" in names
-
-    def test_skip_anonymous_struct(self, parser):
-        source = '''
+SRC_ANONYMOUS_STRUCT = '''
 struct {
     int x;
     int y;
 } point;
 '''
-        symbols = parser.parse(source)
-
-        # Anonymous struct should be skipped
-        assert len(symbols) == 0
-
-    def test_parse_fixture_file(self, parser):
-        """Test parsing the C fixture file."""
-        fixture_path = os.path.join(
-            os.path.dirname(__file__), "fixtures", "sample_module.c"
-        )
-        with open(fixture_path, "r") as f:
-            source = f.read()
-        symbols = parser.parse(source, fixture_path)
-
-        # Should find all symbols
-        assert len(symbols) >= 10
-
-        # Check for expected symbol types
-        names = [s.name for s in symbols]
-        types = [s.type for s in symbols]
-
-        assert "Status" in names  # enum
-        assert "Point" in names  # struct
-        assert "Rectangle" in names  # struct
-        assert "add" in names  # function
-        assert "create_array" in names  # function with pointer return
-        assert "main" in names  # main function
-
-        assert "enum" in types
-        assert "struct" in types
-        assert "function" in types
-        assert "typedef" in types
 
-    def test_docstring_extraction(self, parser):
-        source = '''
+SRC_DOC_COMMENT = '''
 /**
  * Calculate the sum of two numbers.
  * @param a First number
@@ -197,39 +100,16 @@ int sum(int a, int b) {
     return a + b;
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].docstring is not None
-        assert "sum" in symbols[0].docstring.lower() or "Calculate" in symbols[0].docstring
-
-    def test_parser_extensions(self, parser):
-        """Test that parser handles correct extensions."""
-        assert ".c" in parser.extensions
-        assert ".h" in parser.extensions
-
-    def test_parser_language(self, parser):
-        """Test parser language property."""
-        assert parser.language == "c"
-
-    def test_function_with_struct_param(self, parser):
-        source = '''
+SRC_STRUCT_PARAM = '''
 struct Point { int x; int y; };
 
 void print_point(struct Point p) {
     printf("%d, %d\\n", p.x, p.y);
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 2
-        func = next(s for s in symbols if s.type == "function")
-        assert func.name == "print_point"
-        assert "struct Point p" in func.signature
-
-    def test_parse_header_with_include_guard(self, parser):
-        """Test that symbols inside #ifndef include guards are extracted."""
-        source = '''
+SRC_INCLUDE_GUARD = '''
 #ifndef MY_HEADER_H
 #define MY_HEADER_H
 
@@ -251,48 +131,24 @@ static inline int add(int a, int b) {
 
 #endif
 '''
-        symbols = parser.parse(source, "test.h")
 
-        names = [s.name for s in symbols]
-        assert "byte" in names
-        assert "Point" in names
-        assert "Status" in names
-        assert "add" in names
-        assert len(symbols) == 4
-
-    def test_parse_ifdef_else_blocks(self, parser):
-        """Test that symbols inside #ifdef/#else blocks are extracted."""
-        source = '''
+SRC_IFDEF_ELSE = '''
 #ifdef WIN32
 int win_func(void) { return 1; }
 #else
 int unix_func(void) { return 2; }
 #endif
 '''
-        symbols = parser.parse(source)
 
-        names = [s.name for s in symbols]
-        assert "win_func" in names
-        assert "unix_func" in names
-
-    def test_parse_preproc_if_elif(self, parser):
-        """Test that symbols inside #if/#elif blocks are extracted."""
-        source = '''
+SRC_PREPROC_IF_ELIF = '''
 #if defined(DEBUG)
 void debug_log(const char *msg) { }
 #elif defined(VERBOSE)
 void verbose_log(const char *msg) { }
 #endif
 '''
-        symbols = parser.parse(source)
 
-        names = [s.name for s in symbols]
-        assert "debug_log" in names
-        assert "verbose_log" in names
-
-    def test_parse_mixed_preprocessor_and_toplevel(self, parser):
-        """Test files with both preprocessor-wrapped and top-level symbols."""
-        source = '''
+SRC_MIXED_PREPROC = '''
 #include <stdio.h>
 
 int always_available(void) { return 1; }
@@ -305,16 +161,8 @@ struct Config {
     int value;
 };
 '''
-        symbols = parser.parse(source)
-
-        names = [s.name for s in symbols]
-        assert "always_available" in names
-        assert "feature_x_func" in names
-        assert "Config" in names
 
-    def test_parse_typedef_with_embedded_enum_in_guard(self, parser):
-        """Test typedef with embedded enum inside include guard (jv.h pattern)."""
-        source = '''
+SRC_TYPEDEF_IN_GUARD = '''
 #ifndef JV_H
 #define JV_H
 
@@ -330,8 +178,178 @@ typedef struct {
 
 #endif
 '''
+
+
+# Near-duplicate "one symbol in, check name/type/signature/docstring" cases,
+# collapsed into a single parametrized test:
+# (source, name, type, signature or None, docstring substring or None)
+SINGLE_SYMBOL_CASES = [
+    pytest.param(SRC_SIMPLE_FUNCTION, "add", "function", "(int a, int b)", None,
+                 id="simple_function"),
+    pytest.param(SRC_POINTER_RETURN, "create_array", "function", "(size_t size)", None,
+                 id="pointer_return"),
+    pytest.param(SRC_VOID_FUNCTION, "print_hello", "function", None, None,
+                 id="void_function"),
+    pytest.param(SRC_STRUCT, "Point", "struct", None, "2D point",
+                 id="struct"),
+    pytest.param(SRC_ENUM, "Status", "enum", None, None,
+                 id="enum"),
+    pytest.param(SRC_TYPEDEF_PRIMITIVE, "byte", "typedef", None, None,
+                 id="typedef_primitive"),
+]
+
+
+class TestCParser:
+    """Tests for CParser class."""
+
+    @pytest.fixture(scope="module")
+    def parser(self):
+        # One parser per module: tree-sitter parser construction loads the
+        # grammar and is safe to reuse sequentially across tests.
+        return CParser()
+
+    @pytest.mark.parametrize(
+        "source, name, symbol_type, signature, docstring_part",
+        SINGLE_SYMBOL_CASES,
+    )
+    def test_parse_single_symbol(self, parser, source, name, symbol_type,
+                                 signature, docstring_part):
         symbols = parser.parse(source)
 
-        names = [s.name for s in symbols]
+        assert len(symbols) == 1
+        assert symbols[0].name == name
+        assert symbols[0].type == symbol_type
+        if signature is not None:
+            assert symbols[0].signature == signature
+        if docstring_part is not None:
+            assert docstring_part in symbols[0].docstring
+
+    def test_parse_typedef_enum(self, parser):
+        symbols = parser.parse(SRC_TYPEDEF_ENUM)
+
+        assert len(symbols) == 2
+        names = {s.name for s in symbols}
+        types = {s.type for s in symbols}
+        assert "Status" in names
+        assert "StatusCode" in names
+        assert "enum" in types
+        assert "typedef" in types
+
+    def test_parse_multiple_functions(self, parser):
+        symbols = parser.parse(SRC_MULTIPLE_FUNCTIONS)
+
+        assert len(symbols) == 3
+        names = {s.name for s in symbols}
+        assert "add" in names
+        assert "sub" in names
+        assert "mul" in names
+
+    def test_parse_nested_struct(self, parser):
+        symbols = parser.parse(SRC_NESTED_STRUCT)
+
+        assert len(symbols) == 2
+        names = {s.name for s in symbols}
+        assert "Point" in names
+        assert "Rectangle" in names
+
+    def test_skip_anonymous_struct(self, parser):
+        symbols = parser.parse(SRC_ANONYMOUS_STRUCT)
+
+        # Anonymous struct should be skipped
+        assert len(symbols) == 0
+
+    def test_parse_fixture_file(self, parser):
+        """Test parsing the C fixture file through the zero-copy mmap path."""
+        symbols = parser.parse_file(C_FIXTURE_PATH)
+
+        # Should find all symbols
+        assert len(symbols) >= 10
+
+        # Check for expected symbol types
+        names = {s.name for s in symbols}
+        types = {s.type for s in symbols}
+
+        # enum, structs, plain/pointer-returning functions, main
+        assert {"Status", "Point", "Rectangle", "add", "create_array", "main"} <= names
+        assert {"enum", "struct", "function", "typedef"} <= types
+
+    def test_docstring_extraction(self, parser):
+        symbols = parser.parse(SRC_DOC_COMMENT)
+
+        assert len(symbols) == 1
+        assert symbols[0].docstring is not None
+        assert "sum" in symbols[0].docstring.lower() or "Calculate" in symbols[0].docstring
+
+    def test_parser_extensions(self, parser):
+        """Test that parser handles correct extensions."""
+        assert ".c" in parser.extensions
+        assert ".h" in parser.extensions
+
+    def test_parser_language(self, parser):
+        """Test parser language property."""
+        assert parser.language == "c"
+
+    def test_function_with_struct_param(self, parser):
+        symbols = parser.parse(SRC_STRUCT_PARAM)
+
+        assert len(symbols) == 2
+        func = next(s for s in symbols if s.type == "function")
+        assert func.name == "print_point"
+        assert "struct Point p" in func.signature
+
+    def test_parse_header_with_include_guard(self, parser):
+        """Test that symbols inside #ifndef include guards are extracted."""
+        symbols = parser.parse(SRC_INCLUDE_GUARD, "test.h")
+
+        names = {s.name for s in symbols}
+        assert "byte" in names
+        assert "Point" in names
+        assert "Status" in names
+        assert "add" in names
+        assert len(symbols) == 4
+
+    def test_parse_ifdef_else_blocks(self, parser):
+        """Test that symbols inside #ifdef/#else blocks are extracted."""
+        symbols = parser.parse(SRC_IFDEF_ELSE)
+
+        names = {s.name for s in symbols}
+        assert "win_func" in names
+        assert "unix_func" in names
+
+    def test_parse_preproc_if_elif(self, parser):
+        """Test that symbols inside #if/#elif blocks are extracted."""
+        symbols = parser.parse(SRC_PREPROC_IF_ELIF)
+
+        names = {s.name for s in symbols}
+        assert "debug_log" in names
+        assert "verbose_log" in names
+
+    def test_parse_mixed_preprocessor_and_toplevel(self, parser):
+        """Test files with both preprocessor-wrapped and top-level symbols."""
+        symbols = parser.parse(SRC_MIXED_PREPROC)
+
+        names = {s.name for s in symbols}
+        assert "always_available" in names
+        assert "feature_x_func" in names
+        assert "Config" in names
+
+    def test_parse_many_batched(self, parser):
+        """Batched parsing matches one-at-a-time results."""
+        items = [
+            (SRC_SIMPLE_FUNCTION, "add.c"),
+            (SRC_STRUCT, "point.c"),
+            (SRC_ENUM, "status.c"),
+        ]
+        results = CParser.parse_many(items, workers=1)
+
+        assert [path for path, _ in results] == ["add.c", "point.c", "status.c"]
+        for (source, path), (_, symbols) in zip(items, results):
+            assert symbols == parser.parse(source, path)
+
+    def test_parse_typedef_with_embedded_enum_in_guard(self, parser):
+        """Test typedef with embedded enum inside include guard (jv.h pattern)."""
+        symbols = parser.parse(SRC_TYPEDEF_IN_GUARD)
+
+        names = {s.name for s in symbols}
         assert "jv_kind" in names
         assert "jv" in names
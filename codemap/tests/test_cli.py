@@ -169,7 +169,7 @@ def new_function():
     def test_version_flag(self, runner):
         result = runner.invoke(cli, ["--version"])
         assert result.exit_code == 0
-        assert "1.2.0" in result.output
+        assert "1.2.82" in result.output
 
     def test_init_with_language_filter(self, runner, tmp_path, monkeypatch):
         # Create files of different types
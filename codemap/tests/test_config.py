@@ -2,23 +2,23 @@
 
 import pytest
 from pathlib import Path
-from codemap.utils.config import Config, DEFAULT_INCLUDE_PATTERNS
+from codemap.utils.config import DEFAULT_INCLUDE_PATTERNS
 
 
 class TestConfig:
     """Test configuration defaults and loading."""
 
-    def test_default_languages_include_all(self):
+    def test_default_languages_include_all(self, default_config):
         """Verify all supported languages are in defaults."""
-        config = Config()
         expected_languages = [
             "python", "typescript", "javascript", "markdown", "yaml",
             "kotlin", "swift", "c", "cpp", "html", "css", "php",
             "csharp", "dart", "go", "java", "rust", "sql"
         ]
 
+        language_set = default_config.language_set
         for lang in expected_languages:
-            assert lang in config.languages, f"{lang} missing from default config"
+            assert lang in language_set, f"{lang} missing from default config"
 
     def test_default_include_patterns_complete(self):
         """Verify all language extensions in default patterns."""
@@ -4,8 +4,11 @@ import os
 
 import pytest
 
-# Skip all tests if tree-sitter-cpp is not installed
-pytest.importorskip("tree_sitter_cpp")
+# Skip the whole module if tree-sitter-cpp is not installed
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_cpp"]:
+    pytest.skip("tree_sitter_cpp not installed", allow_module_level=True)
 
 from codemap.parsers.cpp_parser import CppParser
 
@@ -2,35 +2,26 @@
 
 import pytest
 
-# Skip all tests if tree-sitter-c-sharp is not installed
-pytest.importorskip("tree_sitter_c_sharp")
-
-from codemap.parsers.csharp_parser import CSharpParser
+# Skip the whole module if tree-sitter-c-sharp is not installed
+from codemap.tests.conftest import AVAILABLE
 
+if not AVAILABLE["tree_sitter_c_sharp"]:
+    pytest.skip("tree_sitter_c_sharp not installed", allow_module_level=True)
 
-class TestCSharpParser:
-    """Tests for CSharpParser class."""
+from codemap.parsers.csharp_parser import CSharpParser
 
-    @pytest.fixture
-    def parser(self):
-        return CSharpParser()
 
-    def test_parse_simple_class(self, parser):
-        source = '''
+# Source snippets hoisted to module scope so each literal is built once at
+# import instead of once per test call.
+SRC_SIMPLE_CLASS = '''
 public class User
 {
     public int Id { get; set; }
     public string Name { get; set; }
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "User"
-        assert symbols[0].type == "class"
 
-    def test_parse_class_with_methods(self, parser):
-        source = '''
+SRC_CLASS_WITH_METHODS = '''
 public class Calculator
 {
     public int Add(int a, int b)
@@ -44,47 +35,24 @@ public class Calculator
     }
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        calc = symbols[0]
-        assert calc.name == "Calculator"
-        assert calc.type == "class"
-        assert len(calc.children) == 2
-        method_names = [c.name for c in calc.children]
-        assert "Add" in method_names
-        assert "Subtract" in method_names
 
-    def test_parse_interface(self, parser):
-        source = '''
+SRC_INTERFACE = '''
 public interface IUserService
 {
     User GetUser(int id);
     void CreateUser(string name);
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "IUserService"
-        assert symbols[0].type == "interface"
 
-    def test_parse_struct(self, parser):
-        source = '''
+SRC_STRUCT = '''
 public struct Point
 {
     public int X;
     public int Y;
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "Point"
-        assert symbols[0].type == "struct"
 
-    def test_parse_enum(self, parser):
-        source = '''
+SRC_ENUM = '''
 public enum Status
 {
     Active,
@@ -92,14 +60,8 @@ public enum Status
     Pending
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "Status"
-        assert symbols[0].type == "enum"
-
-    def test_parse_async_method(self, parser):
-        source = '''
+SRC_ASYNC_METHOD = '''
 public class Service
 {
     public async Task<User> GetUserAsync(int id)
@@ -109,18 +71,8 @@ public class Service
     }
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        service = symbols[0]
-        assert len(service.children) >= 1
-        method = service.children[0]
-        assert method.name == "GetUserAsync"
-        # Note: async detection depends on parser implementation
-        assert method.type in ("method", "async_method")
 
-    def test_parse_constructor(self, parser):
-        source = '''
+SRC_CONSTRUCTOR = '''
 public class User
 {
     private string name;
@@ -136,17 +88,8 @@ public class User
     }
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        user = symbols[0]
-        assert user.name == "User"
-        method_names = [c.name for c in user.children]
-        assert "User" in method_names  # Constructor
-        assert "GetName" in method_names
 
-    def test_parse_multiple_classes(self, parser):
-        source = '''
+SRC_MULTIPLE_CLASSES = '''
 class First
 {
     void Method1() {}
@@ -162,18 +105,8 @@ class Third
     void Method3() {}
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 3
-        names = [s.name for s in symbols]
-        assert "First" in names
-        assert "Second" in names
-        assert "Third" in names
 
-    def test_parse_fixture_file(self, parser):
-        """Test parsing the C# fixture file without namespace wrapper."""
-        # Test with code that doesn't have a namespace wrapper
-        source = '''
+SRC_MIXED_TYPES = '''
 public class User
 {
     public int Id { get; set; }
@@ -197,19 +130,8 @@ public enum UserStatus
     Inactive
 }
 '''
-        symbols = parser.parse(source)
-
-        # Should find multiple symbols
-        assert len(symbols) >= 3
-
-        names = [s.name for s in symbols]
-        assert "User" in names
-        assert "IUserService" in names
-        assert "UserStatus" in names
 
-    def test_parse_namespace_wrapped_classes(self, parser):
-        """Test that classes inside namespaces are found."""
-        source = '''
+SRC_NAMESPACE_WRAPPED = '''
 namespace MyApp.Models
 {
     public class User
@@ -223,15 +145,8 @@ namespace MyApp.Models
     }
 }
 '''
-        symbols = parser.parse(source)
-        assert len(symbols) == 2
-        names = [s.name for s in symbols]
-        assert "User" in names
-        assert "Order" in names
 
-    def test_parse_file_scoped_namespace(self, parser):
-        """Test file-scoped namespace (C# 10+)."""
-        source = '''
+SRC_FILE_SCOPED_NAMESPACE = '''
 namespace MyApp.Services;
 
 public class OrderService
@@ -241,15 +156,8 @@ public class OrderService
     }
 }
 '''
-        symbols = parser.parse(source)
-        assert len(symbols) == 1
-        assert symbols[0].name == "OrderService"
-        assert len(symbols[0].children) == 1
-        assert symbols[0].children[0].name == "ProcessOrder"
 
-    def test_parse_nested_namespaces(self, parser):
-        """Test nested namespace declarations."""
-        source = '''
+SRC_NESTED_NAMESPACES = '''
 namespace Outer
 {
     namespace Inner
@@ -261,13 +169,8 @@ namespace Outer
     }
 }
 '''
-        symbols = parser.parse(source)
-        assert len(symbols) == 1
-        assert symbols[0].name == "DeepClass"
 
-    def test_parse_namespace_with_multiple_types(self, parser):
-        """Test namespace containing class, interface, enum, and struct."""
-        source = '''
+SRC_NAMESPACE_MULTIPLE_TYPES = '''
 namespace MyApp
 {
     public class MyClass {}
@@ -276,7 +179,114 @@ namespace MyApp
     public struct MyStruct {}
 }
 '''
+
+
+# Near-duplicate "one symbol in, check name/type" cases, collapsed into a
+# single parametrized test: (source, name, type)
+SINGLE_SYMBOL_CASES = [
+    pytest.param(SRC_SIMPLE_CLASS, "User", "class", id="class"),
+    pytest.param(SRC_INTERFACE, "IUserService", "interface", id="interface"),
+    pytest.param(SRC_STRUCT, "Point", "struct", id="struct"),
+    pytest.param(SRC_ENUM, "Status", "enum", id="enum"),
+]
+
+
+class TestCSharpParser:
+    """Tests for CSharpParser class."""
+
+    @pytest.fixture(scope="module")
+    def parser(self):
+        # One parser per module: tree-sitter parser construction loads the
+        # grammar and is safe to reuse sequentially across tests.
+        return CSharpParser()
+
+    @pytest.mark.parametrize("source, name, symbol_type", SINGLE_SYMBOL_CASES)
+    def test_parse_single_symbol(self, parser, source, name, symbol_type):
         symbols = parser.parse(source)
+
+        assert len(symbols) == 1
+        assert symbols[0].name == name
+        assert symbols[0].type == symbol_type
+
+    def test_parse_class_with_methods(self, parser):
+        symbols = parser.parse(SRC_CLASS_WITH_METHODS)
+
+        assert len(symbols) == 1
+        calc = symbols[0]
+        assert calc.name == "Calculator"
+        assert calc.type == "class"
+        assert len(calc.children) == 2
+        method_names = {c.name for c in calc.children}
+        assert "Add" in method_names
+        assert "Subtract" in method_names
+
+    def test_parse_async_method(self, parser):
+        symbols = parser.parse(SRC_ASYNC_METHOD)
+
+        assert len(symbols) == 1
+        service = symbols[0]
+        assert len(service.children) >= 1
+        method = service.children[0]
+        assert method.name == "GetUserAsync"
+        # Note: async detection depends on parser implementation
+        assert method.type in ("method", "async_method")
+
+    def test_parse_constructor(self, parser):
+        symbols = parser.parse(SRC_CONSTRUCTOR)
+
+        assert len(symbols) == 1
+        user = symbols[0]
+        assert user.name == "User"
+        method_names = {c.name for c in user.children}
+        assert "User" in method_names  # Constructor
+        assert "GetName" in method_names
+
+    def test_parse_multiple_classes(self, parser):
+        symbols = parser.parse(SRC_MULTIPLE_CLASSES)
+
+        assert len(symbols) == 3
+        names = {s.name for s in symbols}
+        assert "First" in names
+        assert "Second" in names
+        assert "Third" in names
+
+    def test_parse_fixture_file(self, parser):
+        """Test parsing mixed top-level types without a namespace wrapper."""
+        symbols = parser.parse(SRC_MIXED_TYPES)
+
+        # Should find multiple symbols
+        assert len(symbols) >= 3
+
+        names = {s.name for s in symbols}
+        assert "User" in names
+        assert "IUserService" in names
+        assert "UserStatus" in names
+
+    def test_parse_namespace_wrapped_classes(self, parser):
+        """Test that classes inside namespaces are found."""
+        symbols = parser.parse(SRC_NAMESPACE_WRAPPED)
+        assert len(symbols) == 2
+        names = {s.name for s in symbols}
+        assert "User" in names
+        assert "Order" in names
+
+    def test_parse_file_scoped_namespace(self, parser):
+        """Test file-scoped namespace (C# 10+)."""
+        symbols = parser.parse(SRC_FILE_SCOPED_NAMESPACE)
+        assert len(symbols) == 1
+        assert symbols[0].name == "OrderService"
+        assert len(symbols[0].children) == 1
+        assert symbols[0].children[0].name == "ProcessOrder"
+
+    def test_parse_nested_namespaces(self, parser):
+        """Test nested namespace declarations."""
+        symbols = parser.parse(SRC_NESTED_NAMESPACES)
+        assert len(symbols) == 1
+        assert symbols[0].name == "DeepClass"
+
+    def test_parse_namespace_with_multiple_types(self, parser):
+        """Test namespace containing class, interface, enum, and struct."""
+        symbols = parser.parse(SRC_NAMESPACE_MULTIPLE_TYPES)
         assert len(symbols) == 4
         types = {s.type for s in symbols}
         assert types == {"class", "interface", "enum", "struct"}
@@ -6,7 +6,7 @@ from pathlib import Path
 from codemap.parsers.css_parser import CssParser, TREE_SITTER_AVAILABLE
 
 
-# Skip all tests if tree-sitter-css is not installed
+# Skip the whole module if tree-sitter-css is not installed
 pytestmark = pytest.mark.skipif(
     not TREE_SITTER_AVAILABLE,
     reason="tree-sitter-css not installed"
@@ -2,8 +2,11 @@
 
 import pytest
 
-# Skip all tests if tree-sitter-language-pack is not installed
-pytest.importorskip("tree_sitter_language_pack")
+# Skip the whole module if tree-sitter-language-pack is not installed
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_language_pack"]:
+    pytest.skip("tree_sitter_language_pack not installed", allow_module_level=True)
 
 from codemap.parsers.dart_parser import DartParser
 
@@ -2,7 +2,60 @@
 
 import pytest
 from pathlib import Path
-from codemap.utils.file_utils import get_language, _get_extensions_for_languages
+from codemap.utils.file_utils import (
+    get_language,
+    get_language_from_suffix,
+    should_exclude,
+    _get_extensions_for_languages,
+    _match_glob_pattern,
+)
+
+
+class TestGlobMatching:
+    """Test the compiled glob matcher used by should_exclude."""
+
+    @pytest.mark.parametrize("filepath,pattern,expected", [
+        ("node_modules/a.js", "**/node_modules/**", True),
+        ("src/node_modules/a.js", "**/node_modules/**", True),
+        ("src/a.py", "**/node_modules/**", False),
+        ("a/x.min.js", "**/*.min.js", True),
+        ("x.min.js", "**/*.min.js", True),
+        ("x.js", "**/*.min.js", False),
+        ("c.py", "*.py", True),
+        # fnmatch semantics: without **, * also crosses separators
+        ("a/b/c.py", "*.py", True),
+        ("a/b/c.py", "**", True),
+        ("a/mid/d.py", "a/**/d.py", True),
+        ("a/d.py", "a/**/d.py", True),
+    ])
+    def test_match_glob_pattern(self, filepath, pattern, expected):
+        assert _match_glob_pattern(filepath, pattern) is expected
+
+    def test_should_exclude_defaults(self):
+        assert should_exclude("venv/lib/x.py") is True
+        assert should_exclude("src/main.py") is False
+
+    def test_alternation_matches_per_pattern_loop(self):
+        """The combined exclude regex agrees with pattern-by-pattern matching."""
+        from codemap.utils.config import DEFAULT_EXCLUDE_PATTERNS
+
+        paths = [
+            "src/main.py",
+            "node_modules/pkg/index.js",
+            "a/b/__pycache__/m.pyc",
+            "app/static/x.min.js",
+            "docs/readme.md",
+            "build/out/mod.py",
+        ]
+        for path in paths:
+            expected = any(
+                _match_glob_pattern(path, p) for p in DEFAULT_EXCLUDE_PATTERNS
+            )
+            assert should_exclude(path) is expected
+
+    def test_match_backslash_normalization(self):
+        """Windows-style separators are normalized before matching."""
+        assert should_exclude("src\\node_modules\\a.js", ["**/node_modules/**"]) is True
 
 
 class TestLanguageDetection:
@@ -18,9 +71,17 @@ class TestLanguageDetection:
     ])
     def test_get_language_missing_extensions(self, extension, expected_lang):
         """Test that previously missing extensions now map correctly."""
-        test_file = Path(f"test{extension}")
-        detected = get_language(test_file)
-        assert detected == expected_lang
+        # Suffix fast path (no Path construction)
+        assert get_language_from_suffix(extension) == expected_lang
+        # Path-taking entry point routes to the same map
+        assert get_language(Path(f"test{extension}")) == expected_lang
+
+    def test_get_language_repeated_lookups_consistent(self):
+        """The shared extension map returns identical results across calls."""
+        for _ in range(3):
+            assert get_language(Path("a.py")) == "python"
+            assert get_language(Path("A.RS")) == "rust"
+            assert get_language(Path("noext")) is None
 
     def test_get_extensions_for_languages_missing(self):
         """Test extension mapping for previously missing languages."""
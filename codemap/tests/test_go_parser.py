@@ -2,8 +2,11 @@
 
 import pytest
 
-# Skip all tests if tree-sitter-go is not installed
-pytest.importorskip("tree_sitter_go")
+# Skip the whole module if tree-sitter-go is not installed
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_go"]:
+    pytest.skip("tree_sitter_go not installed", allow_module_level=True)
 
 from codemap.parsers.go_parser import GoParser
 
@@ -6,7 +6,7 @@ from pathlib import Path
 from codemap.parsers.html_parser import HtmlParser, TREE_SITTER_AVAILABLE
 
 
-# Skip all tests if tree-sitter-html is not installed
+# Skip the whole module if tree-sitter-html is not installed
 pytestmark = pytest.mark.skipif(
     not TREE_SITTER_AVAILABLE,
     reason="tree-sitter-html not installed"
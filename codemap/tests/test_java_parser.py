@@ -2,8 +2,11 @@
 
 import pytest
 
-# Skip all tests if tree-sitter-java is not installed
-pytest.importorskip("tree_sitter_java")
+# Skip the whole module if tree-sitter-java is not installed
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_java"]:
+    pytest.skip("tree_sitter_java not installed", allow_module_level=True)
 
 from codemap.parsers.java_parser import JavaParser
 
@@ -2,7 +2,7 @@
 
 import pytest
 
-# Skip all tests if tree-sitter is not available
+# Skip the whole module if tree-sitter is not available
 try:
     from codemap.parsers.javascript_parser import JavaScriptParser, TREE_SITTER_AVAILABLE
 except ImportError:
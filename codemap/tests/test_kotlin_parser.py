@@ -2,8 +2,11 @@
 
 import pytest
 
-# Skip all tests if tree-sitter-kotlin is not installed
-pytest.importorskip("tree_sitter_kotlin")
+# Skip the whole module if tree-sitter-kotlin is not installed
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_kotlin"]:
+    pytest.skip("tree_sitter_kotlin not installed", allow_module_level=True)
 
 from codemap.parsers.kotlin_parser import KotlinParser
 
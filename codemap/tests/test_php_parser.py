@@ -4,8 +4,11 @@ import os
 
 import pytest
 
-# Skip all tests if tree-sitter-php is not installed
-pytest.importorskip("tree_sitter_php")
+# Skip the whole module if tree-sitter-php is not installed
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_php"]:
+    pytest.skip("tree_sitter_php not installed", allow_module_level=True)
 
 from codemap.parsers.php_parser import PHPParser
 
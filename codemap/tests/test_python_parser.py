@@ -215,3 +215,24 @@ class Class2:
         assert symbols[1].name == "Class1"
         assert symbols[2].name == "func2"
         assert symbols[3].name == "Class2"
+
+
+class TestParseMany:
+    """Tests for the batched Parser.parse_many entry point."""
+
+    def test_parse_many_sequential(self):
+        items = [("def one():\n    pass\n", "one.py"), ("def two():\n    pass\n", "two.py")]
+        results = PythonParser.parse_many(items, workers=1)
+
+        assert [path for path, _ in results] == ["one.py", "two.py"]
+        assert results[0][1][0].name == "one"
+        assert results[1][1][0].name == "two"
+
+    def test_parse_many_parallel(self):
+        items = [(f"def func{i}():\n    pass\n", f"file{i}.py") for i in range(8)]
+        results = PythonParser.parse_many(items, workers=2)
+
+        assert len(results) == 8
+        for i, (path, symbols) in enumerate(results):
+            assert path == f"file{i}.py"
+            assert symbols[0].name == f"func{i}"
@@ -2,8 +2,11 @@
 
 import pytest
 
-# Skip all tests if tree-sitter-ruby is not installed
-pytest.importorskip("tree_sitter_ruby")
+# Skip the whole module if tree-sitter-ruby is not installed
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_ruby"]:
+    pytest.skip("tree_sitter_ruby not installed", allow_module_level=True)
 
 from codemap.parsers.ruby_parser import RubyParser
 
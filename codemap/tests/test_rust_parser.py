@@ -2,8 +2,11 @@
 
 import pytest
 
-# Skip all tests if tree-sitter-rust is not installed
-pytest.importorskip("tree_sitter_rust")
+# Skip the whole module if tree-sitter-rust is not installed
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_rust"]:
+    pytest.skip("tree_sitter_rust not installed", allow_module_level=True)
 
 from codemap.parsers.rust_parser import RustParser
 
@@ -5,7 +5,10 @@ import os
 import pytest
 
 # Skip if grammar not installed
-pytest.importorskip("tree_sitter_sql")
+from codemap.tests.conftest import AVAILABLE
+
+if not AVAILABLE["tree_sitter_sql"]:
+    pytest.skip("tree_sitter_sql not installed", allow_module_level=True)
 
 from codemap.parsers.sql_parser import SQLParser
 
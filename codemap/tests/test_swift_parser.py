@@ -1,47 +1,32 @@
 """Tests for the Swift parser."""
 
-import pytest
+from pathlib import Path
 
-# Skip all tests if tree-sitter-swift is not installed
-pytest.importorskip("tree_sitter_swift")
+import pytest
 
-from codemap.parsers.swift_parser import SwiftParser
+# Skip the whole module if tree-sitter-swift is not installed
+from codemap.tests.conftest import AVAILABLE
 
+if not AVAILABLE["tree_sitter_swift"]:
+    pytest.skip("tree_sitter_swift not installed", allow_module_level=True)
 
-class TestSwiftParser:
-    """Tests for SwiftParser class."""
+from codemap.parsers.swift_parser import SwiftParser
 
-    @pytest.fixture
-    def parser(self):
-        return SwiftParser()
 
-    def test_parse_simple_struct(self, parser):
-        source = '''
+SRC_STRUCT = '''
 struct User {
     let id: Int
     let name: String
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "User"
-        assert symbols[0].type == "struct"
-
-    def test_parse_class(self, parser):
-        source = '''
+SRC_CLASS = '''
 class AppConfig {
     let version = "1.0.0"
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "AppConfig"
-        assert symbols[0].type == "class"
-
-    def test_parse_class_with_methods(self, parser):
-        source = '''
+SRC_CLASS_WITH_METHODS = '''
 class Calculator {
     func add(a: Int, b: Int) -> Int {
         return a + b
@@ -52,46 +37,23 @@ class Calculator {
     }
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        calc = symbols[0]
-        assert calc.name == "Calculator"
-        assert calc.type == "class"
-        assert len(calc.children) == 2
-        assert calc.children[0].name == "add"
-        assert calc.children[0].type == "method"
-        assert calc.children[1].name == "subtract"
-
-    def test_parse_protocol(self, parser):
-        source = '''
+SRC_PROTOCOL = '''
 protocol UserService {
     func getUser(id: Int) -> User?
     func createUser(name: String) -> User
 }
 '''
-        symbols = parser.parse(source)
-
-        assert len(symbols) == 1
-        assert symbols[0].name == "UserService"
-        assert symbols[0].type == "interface"
 
-    def test_parse_enum(self, parser):
-        source = '''
+SRC_ENUM = '''
 enum Status {
     case active
     case inactive
     case pending
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 1
-        assert symbols[0].name == "Status"
-        assert symbols[0].type == "enum"
-
-    def test_parse_top_level_function(self, parser):
-        source = '''
+SRC_TOP_LEVEL_FUNCTIONS = '''
 func validateEmail(_ email: String) -> Bool {
     return email.contains("@")
 }
@@ -100,16 +62,8 @@ func formatName(_ name: String) -> String {
     return name.trimmingCharacters(in: .whitespaces)
 }
 '''
-        symbols = parser.parse(source)
 
-        assert len(symbols) == 2
-        assert symbols[0].name == "validateEmail"
-        assert symbols[0].type == "function"
-        assert symbols[1].name == "formatName"
-        assert symbols[1].type == "function"
-
-    def test_parse_multiple_types(self, parser):
-        source = '''
+SRC_MULTIPLE_TYPES = '''
 struct First {
     func method1() {}
 }
@@ -122,32 +76,101 @@ protocol Third {
     func method3()
 }
 '''
+
+SRC_EXTENSION = '''
+extension Foo {
+    func helper() {}
+    func another() -> Int { return 0 }
+}
+'''
+
+SRC_PREPROCESSOR = '''
+public class MyClass: Base {
+    func normalMethod() {}
+
+    #if canImport(Foundation)
+    func conditionalMethod() {}
+    #endif
+
+    func anotherMethod() {}
+}
+'''
+
+SRC_ENUM_WITH_METHODS = '''
+enum Direction {
+    case north, south
+    func description() -> String { return "" }
+}
+'''
+
+
+SWIFT_FIXTURE_PATH = Path(__file__).parent / "fixtures" / "SampleModule.swift"
+
+
+# (source, expected name, expected type) for sources declaring one symbol
+SINGLE_SYMBOL_CASES = [
+    pytest.param(SRC_STRUCT, "User", "struct", id="struct"),
+    pytest.param(SRC_CLASS, "AppConfig", "class", id="class"),
+    pytest.param(SRC_PROTOCOL, "UserService", "interface", id="protocol"),
+    pytest.param(SRC_ENUM, "Status", "enum", id="enum"),
+]
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """One SwiftParser shared by the module; construction loads the grammar."""
+    return SwiftParser()
+
+
+@pytest.fixture(scope="module")
+def fixture_symbols(parser):
+    """SampleModule.swift parsed once, shared by every test that inspects it."""
+    return parser.parse_file(SWIFT_FIXTURE_PATH)
+
+
+class TestSwiftParser:
+    """Tests for SwiftParser class."""
+
+    @pytest.mark.parametrize("source,name,symbol_type", SINGLE_SYMBOL_CASES)
+    def test_parse_single_symbol(self, parser, source, name, symbol_type):
         symbols = parser.parse(source)
 
+        assert len(symbols) == 1
+        assert symbols[0].name == name
+        assert symbols[0].type == symbol_type
+
+    def test_parse_class_with_methods(self, parser):
+        symbols = parser.parse(SRC_CLASS_WITH_METHODS)
+
+        assert len(symbols) == 1
+        calc = symbols[0]
+        assert calc.name == "Calculator"
+        assert calc.type == "class"
+        got = [(c.name, c.type) for c in calc.children]
+        assert got == [("add", "method"), ("subtract", "method")]
+
+    def test_parse_top_level_function(self, parser):
+        symbols = parser.parse(SRC_TOP_LEVEL_FUNCTIONS)
+
+        assert len(symbols) == 2
+        assert symbols[0].name == "validateEmail"
+        assert symbols[0].type == "function"
+        assert symbols[1].name == "formatName"
+        assert symbols[1].type == "function"
+
+    def test_parse_multiple_types(self, parser):
+        symbols = parser.parse(SRC_MULTIPLE_TYPES)
+
         assert len(symbols) == 3
-        names = [s.name for s in symbols]
-        assert "First" in names
-        assert "Second" in names
-        assert "Third" in names
-
-    def test_parse_fixture_file(self, parser):
-        """Test parsing the Swift fixture file."""
-        import os
-        fixture_path = os.path.join(
-            os.path.dirname(__file__), "fixtures", "SampleModule.swift"
-        )
-        with open(fixture_path, "r") as f:
-            source = f.read()
-
-        symbols = parser.parse(source, fixture_path)
+        assert {s.name for s in symbols} == {"First", "Second", "Third"}
 
+    def test_parse_fixture_file(self, fixture_symbols):
+        """Test parsing the Swift fixture file via the mmap-backed path."""
         # Should find multiple symbols (structs, classes, protocols, enums, functions)
-        assert len(symbols) >= 4
+        assert len(fixture_symbols) >= 4
 
-        names = [s.name for s in symbols]
-        assert "User" in names
-        assert "UserService" in names
-        assert "DefaultUserService" in names
+        names = {s.name for s in fixture_symbols}
+        assert {"User", "UserService", "DefaultUserService"} <= names
 
     def test_extensions(self, parser):
         """Test that the parser handles the correct extensions."""
@@ -159,52 +182,27 @@ protocol Third {
 
     def test_extension_methods_classified_as_methods(self, parser):
         """Extension methods should be classified as methods, not functions."""
-        source = '''
-extension Foo {
-    func helper() {}
-    func another() -> Int { return 0 }
-}
-'''
-        symbols = parser.parse(source)
+        symbols = parser.parse(SRC_EXTENSION)
         assert len(symbols) == 1
         assert symbols[0].name == "Foo"
         assert symbols[0].type == "class"
         assert len(symbols[0].children) == 2
-        for child in symbols[0].children:
-            assert child.type == "method"
+        assert {c.type for c in symbols[0].children} == {"method"}
 
     def test_preprocessor_directives_do_not_break_parsing(self, parser):
         """#if/#endif directives should not cause methods to be misclassified."""
-        source = '''
-public class MyClass: Base {
-    func normalMethod() {}
-
-    #if canImport(Foundation)
-    func conditionalMethod() {}
-    #endif
-
-    func anotherMethod() {}
-}
-'''
-        symbols = parser.parse(source)
+        symbols = parser.parse(SRC_PREPROCESSOR)
         assert len(symbols) == 1
         cls = symbols[0]
         assert cls.name == "MyClass"
         assert cls.type == "class"
         # All functions inside the class should be methods
         assert len(cls.children) == 3
-        for child in cls.children:
-            assert child.type == "method", f"{child.name} should be method, got {child.type}"
+        assert {c.type for c in cls.children} == {"method"}
 
     def test_enum_with_methods(self, parser):
         """Enum methods should be classified as methods."""
-        source = '''
-enum Direction {
-    case north, south
-    func description() -> String { return "" }
-}
-'''
-        symbols = parser.parse(source)
+        symbols = parser.parse(SRC_ENUM_WITH_METHODS)
         assert len(symbols) == 1
         assert symbols[0].type == "enum"
         assert len(symbols[0].children) == 1
@@ -100,3 +100,31 @@ class TestTreeSitterAvailability:
     def test_import_base_classes(self):
         from codemap.parsers.treesitter_base import TreeSitterParser
         assert TreeSitterParser is not None
+
+
+class TestParseFile:
+    """Tests for the mmap-backed parse_file path."""
+
+    @pytest.fixture
+    def parser(self):
+        from codemap.tests.conftest import AVAILABLE
+        if not AVAILABLE["tree_sitter_go"]:
+            pytest.skip("tree_sitter_go not installed")
+        from codemap.parsers.go_parser import GoParser
+        return GoParser()
+
+    def test_parse_file_mmap(self, parser, tmp_path):
+        source_file = tmp_path / "main.go"
+        source_file.write_text("func main() {\n}\n")
+
+        symbols = parser.parse_file(source_file)
+
+        assert len(symbols) == 1
+        assert symbols[0].name == "main"
+        assert symbols[0].type == "function"
+
+    def test_parse_file_empty(self, parser, tmp_path):
+        source_file = tmp_path / "empty.go"
+        source_file.write_text("")
+
+        assert parser.parse_file(source_file) == []
@@ -2,7 +2,7 @@
 
 import pytest
 
-# Skip all tests if tree-sitter is not available
+# Skip the whole module if tree-sitter is not available
 try:
     from codemap.parsers.typescript_parser import TypeScriptParser, TREE_SITTER_AVAILABLE
 except ImportError:
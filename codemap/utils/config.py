@@ -72,6 +72,16 @@ class Config:
     max_docstring_length: int = 150
     output: str = ".codemap.json"
 
+    @property
+    def language_set(self) -> frozenset[str]:
+        """Configured languages as a frozenset for O(1) membership tests.
+
+        Recomputed on access because languages is a mutable list that
+        callers (e.g. Indexer) may replace after construction; bind the
+        result to a local before testing membership in a loop.
+        """
+        return frozenset(self.languages)
+
     def to_dict(self) -> dict:
         """Convert config to dictionary."""
         return {
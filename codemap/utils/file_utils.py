@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
+import os
+import re
 from pathlib import Path
 from typing import Iterator
 
@@ -28,29 +31,42 @@ def discover_files(
         config = Config()
 
     # Determine extensions based on languages
-    extensions = _get_extensions_for_languages(languages or config.languages)
-
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-
-        # Check extension
-        if not any(path.suffix == ext for ext in extensions):
-            continue
-
-        # Get relative path for pattern matching
+    extensions = frozenset(_get_extensions_for_languages(languages or config.languages))
+    exclude_patterns = config.exclude_patterns
+
+    # Iterative scandir walk instead of rglob + is_file(): DirEntry caches
+    # the d_type from readdir, so classifying each entry needs no extra
+    # stat syscall, and no intermediate Path objects are built for the
+    # entries that are filtered out.
+    root_str = os.fspath(root)
+    prefix_len = len(root_str) + 1
+    stack = [root_str]
+    while stack:
         try:
-            rel_path = path.relative_to(root)
-        except ValueError:
+            entries = os.scandir(stack.pop())
+        except OSError:
             continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
 
-        rel_str = str(rel_path)
+                # Check extension
+                if os.path.splitext(entry.name)[1] not in extensions:
+                    continue
 
-        # Check exclude patterns
-        if should_exclude(rel_str, config.exclude_patterns):
-            continue
+                # Check exclude patterns on the root-relative path
+                rel_str = entry.path[prefix_len:]
+                if should_exclude(rel_str, exclude_patterns):
+                    continue
 
-        yield path
+                yield Path(entry.path)
 
 
 def should_exclude(filepath: str, patterns: list[str] | None = None) -> bool:
@@ -65,18 +81,29 @@ def should_exclude(filepath: str, patterns: list[str] | None = None) -> bool:
     """
     if patterns is None:
         patterns = DEFAULT_EXCLUDE_PATTERNS
+    if not patterns:
+        return False
 
     # Normalize path separators
     filepath = filepath.replace("\\", "/")
 
-    for pattern in patterns:
-        # Normalize pattern separators
-        pattern = pattern.replace("\\", "/")
+    rx = _compile_glob_alternation(
+        tuple(pattern.replace("\\", "/") for pattern in patterns)
+    )
+    return rx.match(filepath) is not None
 
-        if _match_glob_pattern(filepath, pattern):
-            return True
 
-    return False
+@functools.lru_cache(maxsize=32)
+def _compile_glob_alternation(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a pattern list into one alternation regex, cached.
+
+    One regex scan per path replaces the per-pattern loop; the pattern
+    list rarely changes between calls, so the tuple key almost always
+    hits the cache.
+    """
+    return re.compile(
+        "|".join(f"(?:{_compile_glob_pattern(p).pattern})" for p in patterns)
+    )
 
 
 def _match_glob_pattern(filepath: str, pattern: str) -> bool:
@@ -89,51 +116,110 @@ def _match_glob_pattern(filepath: str, pattern: str) -> bool:
     Returns:
         True if the filepath matches the pattern.
     """
-    # Simple fnmatch patterns (no **)
-    if "**" not in pattern:
-        return fnmatch.fnmatch(filepath, pattern)
-
-    # Handle ** patterns
-    # Split pattern into parts
-    pattern_parts = pattern.split("/")
-    path_parts = filepath.split("/")
-
-    return _match_parts(path_parts, pattern_parts)
+    return _compile_glob_pattern(pattern).match(filepath) is not None
 
 
-def _match_parts(path_parts: list[str], pattern_parts: list[str]) -> bool:
-    """Recursively match path parts against pattern parts.
+@functools.lru_cache(maxsize=256)
+def _compile_glob_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern (with ** support) to a regex, cached.
 
-    Args:
-        path_parts: List of path components
-        pattern_parts: List of pattern components
-
-    Returns:
-        True if parts match.
+    The previous matcher recursively tried every way a ** could consume
+    path components, re-running fnmatch per component per file. Compiling
+    the whole pattern to one regex turns each check into a single scan,
+    and the cache makes the compile a one-time cost per pattern.
     """
-    if not pattern_parts:
-        return not path_parts
-
-    if not path_parts:
-        # Check if remaining pattern is all ** or empty
-        return all(p == "**" for p in pattern_parts)
-
-    pattern_part = pattern_parts[0]
-
-    if pattern_part == "**":
-        # ** can match zero or more path components
-        # Try matching zero components (skip **)
-        if _match_parts(path_parts, pattern_parts[1:]):
-            return True
-        # Try matching one component and continue with **
-        if _match_parts(path_parts[1:], pattern_parts):
-            return True
-        return False
-    else:
-        # Regular pattern part - must match current path part
-        if fnmatch.fnmatch(path_parts[0], pattern_part):
-            return _match_parts(path_parts[1:], pattern_parts[1:])
-        return False
+    # Simple patterns keep exact fnmatch semantics (where * crosses /)
+    if "**" not in pattern:
+        return re.compile(fnmatch.translate(pattern))
+
+    # ** patterns: ** matches zero or more whole path components; other
+    # parts match exactly one component each.
+    parts = pattern.split("/")
+    if all(part == "**" for part in parts):
+        return re.compile(r".*\Z")
+
+    pieces = []
+    first = True
+    for part in parts:
+        if part == "**":
+            # Zero or more components, with the separator folded in on
+            # the side facing the rest of the pattern.
+            pieces.append(r"(?:[^/]+/)*" if first else r"(?:/[^/]+)*")
+        elif first:
+            pieces.append(_translate_component(part))
+            first = False
+        else:
+            pieces.append("/" + _translate_component(part))
+    return re.compile("".join(pieces) + r"\Z")
+
+
+def _translate_component(part: str) -> str:
+    """Translate one glob path component to a regex fragment.
+
+    Unlike fnmatch.translate, * and ? are kept within a single component
+    (they never match a path separator).
+    """
+    out = []
+    i = 0
+    n = len(part)
+    while i < n:
+        c = part[i]
+        if c == "*":
+            out.append(r"[^/]*")
+        elif c == "?":
+            out.append(r"[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and part[j] == "!":
+                j += 1
+            if j < n and part[j] == "]":
+                j += 1
+            while j < n and part[j] != "]":
+                j += 1
+            if j >= n:
+                out.append(r"\[")
+            else:
+                seq = part[i + 1:j].replace("\\", "\\\\")
+                if seq.startswith("!"):
+                    seq = "^" + seq[1:]
+                out.append(f"[{seq}]")
+                i = j
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+# Built once at import; get_language runs for every discovered file, and
+# rebuilding these literals per call dominated the lookup itself.
+_LANGUAGE_TO_EXTENSIONS = {
+    "python": [".py", ".pyi"],
+    "typescript": [".ts", ".tsx"],
+    "javascript": [".js", ".jsx"],
+    "markdown": [".md", ".markdown"],
+    "yaml": [".yaml", ".yml"],
+    "kotlin": [".kt", ".kts"],
+    "swift": [".swift"],
+    "c": [".c", ".h"],
+    "cpp": [".cpp", ".hpp", ".cc", ".hh", ".cxx", ".hxx"],
+    "html": [".html", ".htm"],
+    "css": [".css"],
+    "php": [".php", ".phtml"],
+    "csharp": [".cs"],
+    "dart": [".dart"],
+    "go": [".go"],
+    "java": [".java"],
+    "rust": [".rs"],
+    "sql": [".sql"],
+    "ruby": [".rb", ".rake", ".gemspec", ".ru", ".thor"],
+}
+
+# Inverse map; .h lands on "c" because only the C list claims it.
+_EXTENSION_TO_LANG = {
+    ext: lang
+    for lang, exts in _LANGUAGE_TO_EXTENSIONS.items()
+    for ext in exts
+}
 
 
 def _get_extensions_for_languages(languages: list[str]) -> list[str]:
@@ -145,33 +231,11 @@ def _get_extensions_for_languages(languages: list[str]) -> list[str]:
     Returns:
         List of file extensions.
     """
-    extension_map = {
-        "python": [".py", ".pyi"],
-        "typescript": [".ts", ".tsx"],
-        "javascript": [".js", ".jsx"],
-        "markdown": [".md", ".markdown"],
-        "yaml": [".yaml", ".yml"],
-        "kotlin": [".kt", ".kts"],
-        "swift": [".swift"],
-        "c": [".c", ".h"],
-        "cpp": [".cpp", ".hpp", ".cc", ".hh", ".cxx", ".hxx"],
-        "html": [".html", ".htm"],
-        "css": [".css"],
-        "php": [".php", ".phtml"],
-        "csharp": [".cs"],
-        "dart": [".dart"],
-        "go": [".go"],
-        "java": [".java"],
-        "rust": [".rs"],
-        "sql": [".sql"],
-        "ruby": [".rb", ".rake", ".gemspec", ".ru", ".thor"],
-    }
-
     extensions = []
     for lang in languages:
         lang_lower = lang.lower()
-        if lang_lower in extension_map:
-            extensions.extend(extension_map[lang_lower])
+        if lang_lower in _LANGUAGE_TO_EXTENSIONS:
+            extensions.extend(_LANGUAGE_TO_EXTENSIONS[lang_lower])
     return extensions
 
 
@@ -200,44 +264,19 @@ def get_language(filepath: Path) -> str | None:
     Returns:
         Language name or None if unknown.
     """
-    suffix = filepath.suffix.lower()
-    extension_to_lang = {
-        ".py": "python",
-        ".pyi": "python",
-        ".ts": "typescript",
-        ".tsx": "typescript",
-        ".js": "javascript",
-        ".jsx": "javascript",
-        ".md": "markdown",
-        ".markdown": "markdown",
-        ".yaml": "yaml",
-        ".yml": "yaml",
-        ".kt": "kotlin",
-        ".kts": "kotlin",
-        ".swift": "swift",
-        ".c": "c",
-        ".h": "c",  # Default to C for .h files
-        ".cpp": "cpp",
-        ".hpp": "cpp",
-        ".cc": "cpp",
-        ".hh": "cpp",
-        ".cxx": "cpp",
-        ".hxx": "cpp",
-        ".html": "html",
-        ".htm": "html",
-        ".css": "css",
-        ".php": "php",
-        ".phtml": "php",
-        ".cs": "csharp",
-        ".dart": "dart",
-        ".go": "go",
-        ".java": "java",
-        ".rs": "rust",
-        ".sql": "sql",
-        ".rb": "ruby",
-        ".rake": "ruby",
-        ".gemspec": "ruby",
-        ".ru": "ruby",
-        ".thor": "ruby",
-    }
-    return extension_to_lang.get(suffix)
+    return _EXTENSION_TO_LANG.get(filepath.suffix.lower())
+
+
+def get_language_from_suffix(suffix: str) -> str | None:
+    """Determine the language for a file extension.
+
+    Fast path for callers that already hold the suffix string and can
+    skip Path construction (e.g. ".py" -> "python").
+
+    Args:
+        suffix: Lowercase file extension including the leading dot.
+
+    Returns:
+        Language name or None if unknown.
+    """
+    return _EXTENSION_TO_LANG.get(suffix)